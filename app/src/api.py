@@ -26,6 +26,7 @@ from .interface.openai_response_formatter import format_sync_response
 from .interface.openai_translator import OpenAiTranslator
 from .observability import (
     event_bus, active_runs, observability_router, init_observability,
+    start_process_stats_publisher,
 )
 
 langsmith_client: Optional[Client] = None
@@ -73,8 +74,14 @@ async def lifespan(app: FastAPI):
         langsmith_client=langsmith_client,
     )
 
+    # CPU/RSS snapshots for `scripts/server.py status` (only when it launched us)
+    stats_publisher = start_process_stats_publisher()
+
     yield
 
+    if stats_publisher:
+        stats_publisher.stop()
+
     # Cleanup external MCP containers on shutdown
     try:
         await workflow_runner.builder.cleanup_external_mcp()
@@ -1,11 +1,12 @@
 # app/src/llm/adapters_helpers.py
-from typing import List
+from typing import List, TYPE_CHECKING
 from langchain_core.messages import BaseMessage, HumanMessage
 
-from google.genai import types
+if TYPE_CHECKING:
+    from google.genai import types
 
 
-def format_gemini_messages(messages: List[BaseMessage], static_system_prompt: str) -> List[types.Content]:
+def format_gemini_messages(messages: List[BaseMessage], static_system_prompt: str) -> List["types.Content"]:
     """
     Prepares a list of LangChain messages for the Google Gemini API (new google-genai SDK).
 
@@ -24,6 +25,8 @@ def format_gemini_messages(messages: List[BaseMessage], static_system_prompt: st
     Returns:
         A list of types.Content objects for the new google-genai SDK.
     """
+    from google.genai import types
+
     # Collect all system instructions: the static one from init and any dynamic ones from runtime.
     system_contents = [static_system_prompt] + [msg.content for msg in messages if msg.type == 'system']
     # Combine all system content into a single block, filtering out any empty strings.
@@ -9,8 +9,6 @@ import os
 import time
 from typing import Dict, Optional, Any
 
-from google import genai
-from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .adapter import BaseAdapter, StandardizedLLMRequest, LLMInvocationError, SafetyFilterError, RateLimitError, ProxyError
@@ -25,6 +23,8 @@ class GeminiAdapter(BaseAdapter):
         # Note: API key validation is in from_config() which is the standard entry point
         super().__init__(model_config)
         self._api_key = api_key
+        # Deferred import: google-genai pulls in ~1s of modules, only needed when Gemini is configured
+        from google import genai
         # New SDK: Create a Client instead of configuring globally
         self.client = genai.Client(api_key=api_key)
         self.model_id = self.config['api_identifier']
@@ -64,6 +64,8 @@ class GeminiAdapter(BaseAdapter):
         reraise=True
     )
     def invoke(self, request: StandardizedLLMRequest) -> Dict[str, Any]:
+        from google.genai import types
+
         # Format messages for Gemini API
         gemini_contents = adapters_helpers.format_gemini_messages(
             messages=request.messages,
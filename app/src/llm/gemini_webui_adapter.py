@@ -16,18 +16,20 @@ IMPORTANT: This is temporary infrastructure for distillation data capture.
 Not intended for long-term production use.
 """
 
+import importlib.util
 import logging
 import time
 import re
 import json
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from pathlib import Path
 
-try:
-    from playwright.sync_api import sync_playwright, Page, Browser, Playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Browser, Playwright
+
+# Deferred import: playwright.sync_api is only needed once a browser is launched,
+# and the factory imports this module whether or not gemini_webui is configured.
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
 
 from pydantic import ValidationError
 
@@ -62,9 +64,9 @@ class GeminiWebUIAdapter(BaseAdapter):
         super().__init__(model_config)
         self.session_cookies_path = credentials.get("session_cookies")
         self.rate_limit_delay = model_config.get("rate_limit_delay", 2.0)
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
-        self.playwright: Optional[Playwright] = None
+        self.browser: Optional["Browser"] = None
+        self.page: Optional["Page"] = None
+        self.playwright: Optional["Playwright"] = None
 
     @property
     def api_base(self) -> Optional[str]:
@@ -149,6 +151,8 @@ class GeminiWebUIAdapter(BaseAdapter):
         Mirrors gemini-exporter's approach but uses server-side Playwright
         instead of Chrome extension.
         """
+        from playwright.sync_api import sync_playwright
+
         logger.info("Initializing Playwright browser...")
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(
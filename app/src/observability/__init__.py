@@ -6,12 +6,14 @@ Provides:
 - Active runs registry: shared state for run discovery
 - Observability API router: FastAPI endpoints for monitoring, traces, archives
 - Training data capture: specialist execution recording for fine-tuning
+- Process stats publisher: CPU/RSS snapshots for the server control script
 """
 
 from .training_capture import TrainingCapture, CapturedExecution, OutcomeStatus
 from .event_bus import event_bus, EventBus
 from .active_runs import active_runs, ActiveRunRegistry
 from .router import router as observability_router, init as init_observability
+from .process_stats import ProcessStatsPublisher, start_process_stats_publisher
 
 __all__ = [
     # Training capture
@@ -22,4 +24,6 @@ __all__ = [
     "active_runs", "ActiveRunRegistry",
     # API router
     "observability_router", "init_observability",
+    # Process stats (read by scripts/server.py status)
+    "ProcessStatsPublisher", "start_process_stats_publisher",
 ]
@@ -0,0 +1,92 @@
+"""
+Process stats publisher -- lets `scripts/server.py status` skip /proc.
+
+When the control script launches the API server, it passes a file path in
+LAS_PROCESS_STATS_FILE. The server then samples its own CPU and RSS every
+few seconds and rewrites that file, so `status` reads one small JSON file
+instead of importing psutil and querying the process itself.
+
+A file rather than multiprocessing.shared_memory: on Python < 3.13, a
+reader attaching to a shared memory block registers it with its own
+resource tracker, which unlinks the block when the (short-lived) reader
+exits.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE_ENV = "LAS_PROCESS_STATS_FILE"
+PUBLISH_INTERVAL_S = 2.0
+
+
+class ProcessStatsPublisher:
+    """Background thread that periodically writes this process's CPU/RSS to a file."""
+
+    def __init__(self, path: str, interval: float = PUBLISH_INTERVAL_S):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="process-stats-publisher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops publishing and removes the file, so readers fall back to live stats."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _run(self) -> None:
+        # Imported here: only servers started by the control script (which
+        # itself requires psutil) ever publish stats.
+        import psutil
+
+        proc = psutil.Process()
+        proc.cpu_percent(interval=None)  # Prime: the next call returns the delta since now
+        while not self._stop.wait(self.interval):
+            try:
+                self._publish(proc)
+            except Exception as e:
+                logger.warning(f"Could not publish process stats to {self.path}: {e}")
+
+    def _publish(self, proc) -> None:
+        with proc.oneshot():
+            stats = {
+                "pid": proc.pid,
+                # Lets readers tell this server's snapshot from one left by
+                # an earlier process with the same PID
+                "create_time": proc.create_time(),
+                "cpu_percent": proc.cpu_percent(interval=None),
+                "rss": proc.memory_info().rss,
+                "interval": self.interval,
+                "updated_at": time.time(),
+            }
+        # Write-then-rename so readers never see a partial file
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(stats, f)
+        os.replace(tmp_path, self.path)
+
+
+def start_process_stats_publisher() -> Optional[ProcessStatsPublisher]:
+    """Starts a publisher if LAS_PROCESS_STATS_FILE is set; otherwise returns None."""
+    path = os.environ.get(STATS_FILE_ENV)
+    if not path:
+        return None
+    publisher = ProcessStatsPublisher(path)
+    publisher.start()
+    logger.info(f"Publishing process stats to {path} every {publisher.interval:g}s")
+    return publisher
@@ -1,5 +1,6 @@
 # src/utils/prompt_loader.py
 
+from functools import lru_cache
 from pathlib import Path
 
 from .path_utils import APP_ROOT
@@ -8,10 +9,16 @@ class PromptLoader:
     A utility class to load prompt templates from the filesystem.
     """
     @staticmethod
+    @lru_cache(maxsize=32)
     def load(prompt_name: str) -> str:
         """
         Loads a prompt from the 'app/prompts' directory.
 
+        Results are memoized per prompt name: prompt files are static for the
+        life of the process, and several specialists reload the same template
+        on every construction or execution. WorkflowRunner.reload() calls
+        ``load.cache_clear()`` so edited prompts take effect on reload.
+
         Args:
             prompt_name (str): The base name of the prompt file (e.g., 'data_extractor_specialist').
 
@@ -96,9 +96,12 @@ class WorkflowRunner:
         """
         logger.info("Reloading WorkflowRunner...")
         from ..utils.config_loader import ConfigLoader
+        from ..utils.prompt_loader import PromptLoader
 
         # Reload configuration with overrides
         ConfigLoader().reload(overrides)
+        # Drop memoized prompt text so rebuilt specialists see edited prompt files
+        PromptLoader.load.cache_clear()
 
         # Re-initialize builder with new config
         self.builder = GraphBuilder()
@@ -5,12 +5,18 @@ to eliminate redundant and inconsistent mocking logic across the test suite,
 creating a modular and resilient testing architecture.
 """
 
+import copy
 import importlib
+import json
 import os
-from unittest.mock import MagicMock, patch
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from app.tests.helpers import make_mock_adapter
+
 
 # =============================================================================
 # ENVIRONMENT DETECTION
@@ -23,6 +29,8 @@ def is_docker() -> bool:
 
 def pytest_configure(config):
     """Print environment banner at test session start."""
+    if hasattr(config, "workerinput"):
+        return  # pytest-xdist worker; the controller prints the banner once
     if not is_docker():
         print("\n" + "=" * 70)
         print("  RUNNING OUTSIDE DOCKER")
@@ -32,6 +40,29 @@ def pytest_configure(config):
         print("=" * 70 + "\n")
 
 
+# Markers that imply a shared LLM provider/environment. Tests carrying the same
+# marker are grouped together so session/module-scoped fixtures stay warm.
+PROVIDER_MARKERS = ("live_llm", "integration", "archive", "esm", "fara")
+
+
+def _collection_sort_key(item) -> tuple:
+    """Sort key of (filename, provider marker, classname) for a collected item."""
+    provider = next(
+        (name for name in PROVIDER_MARKERS if item.get_closest_marker(name)), ""
+    )
+    cls = item.cls.__name__ if item.cls is not None else ""
+    return (str(item.path), provider, cls)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Order tests deterministically so tests sharing a provider run consecutively.
+
+    The sort is stable, so definition order is preserved within each group.
+    """
+    items.sort(key=_collection_sort_key)
+
+
 @pytest.fixture(autouse=True)
 def skip_integration_outside_docker(request):
     """
@@ -62,55 +93,81 @@ def skip_integration_outside_docker(request):
         )
 
 
+@pytest.fixture(scope="session")
+def unit_archive_dir(tmp_path_factory):
+    """Archive directory for unit tests; per xdist worker, since each has its own session."""
+    return tmp_path_factory.mktemp("archives")
+
+
+@pytest.fixture(autouse=True)
+def isolate_unit_test_archives(request, monkeypatch):
+    """
+    Points ArchiverSpecialist (and EndSpecialist's embedded archiver) at a
+    temp directory for unit tests. Without AGENTIC_SCAFFOLD_ARCHIVE_PATH they
+    write to ./archives in the shared working directory, which races when
+    the unit suite runs in parallel. Tests that set the variable themselves
+    still override it.
+    """
+    if "/unit/" not in str(request.fspath):
+        return
+    archive_dir = request.getfixturevalue("unit_archive_dir")
+    monkeypatch.setenv("AGENTIC_SCAFFOLD_ARCHIVE_PATH", str(archive_dir))
+
+
 # =============================================================================
 # TEST FIXTURES (ADR-TS-001)
 # =============================================================================
 
+# Default configuration served by mock_config_loader. Deep-copied per test so
+# in-place edits (e.g. config_override in initialized_specialist_factory) never
+# leak between tests.
+DEFAULT_MOCK_CONFIG = {
+    "llm_providers": {
+        "default_llm": {
+            "type": "gemini",
+            "api_identifier": "gemini-1.5-flash",
+        }
+    },
+    "specialists": {
+        "router_specialist": {
+            "type": "llm",
+            "model": "default_llm",
+            "prompt_template": "router_specialist.md",
+        },
+        "end_specialist": {
+            "type": "hybrid",
+            "llm_config": "default_llm",
+            "synthesis_prompt_file": "response_synthesizer_prompt.md",
+            "archiver_config": {
+                "type": "procedural",
+                "archive_path": "./logs/archive",
+                "pruning_strategy": "count",
+                "pruning_max_count": 50
+            }
+        },
+        # Add other specialist configs as needed for default tests
+    },
+    "specialist_model_bindings": {
+        "router_specialist": "default_llm",
+        "end_specialist": "default_llm",
+    },
+}
+
+
 @pytest.fixture
-def mock_config_loader() -> MagicMock:
+def mock_config_loader() -> Mock:
     """
     (ADR-TS-001, Task 1.1) Creates a mock of the ConfigLoader.
 
-    This fixture returns a MagicMock of the ConfigLoader, pre-configured
+    This fixture returns a Mock of the ConfigLoader, pre-configured
     with a default, valid configuration dictionary. Tests can override this
     default config by modifying the return_value of the mock's get_config method.
 
     Example in a test:
         mock_config_loader.get_config.return_value['specialists']['router_specialist']['model'] = 'new_model'
     """
-    mock = MagicMock()
-    default_config = {
-        "llm_providers": {
-            "default_llm": {
-                "type": "gemini",
-                "api_identifier": "gemini-1.5-flash",
-            }
-        },
-        "specialists": {
-            "router_specialist": {
-                "type": "llm",
-                "model": "default_llm",
-                "prompt_template": "router_specialist.md",
-            },
-            "end_specialist": {
-                "type": "hybrid",
-                "llm_config": "default_llm",
-                "synthesis_prompt_file": "response_synthesizer_prompt.md",
-                "archiver_config": {
-                    "type": "procedural",
-                    "archive_path": "./logs/archive",
-                    "pruning_strategy": "count",
-                    "pruning_max_count": 50
-                }
-            },
-            # Add other specialist configs as needed for default tests
-        },
-        "specialist_model_bindings": {
-            "router_specialist": "default_llm",
-            "end_specialist": "default_llm",
-        },
-    }
-    mock.get_config.return_value = default_config
+    mock = Mock()  # Only get_config() is used; no magic methods needed
+    mock.get_config.return_value = copy.deepcopy(DEFAULT_MOCK_CONFIG)
     return mock
 
 
@@ -120,19 +177,70 @@ def mock_adapter_factory() -> MagicMock:
     (ADR-TS-001, Task 1.2) Creates a mock of the AdapterFactory.
 
     This fixture returns a MagicMock of the AdapterFactory. Its `create_adapter`
-    method is configured to return another MagicMock by default, representing
-    a generic, mocked LLM adapter.
+    method is configured to return a spec_set Mock by default (see
+    make_mock_adapter), representing a generic, mocked LLM adapter.
     """
     mock = MagicMock()
-    mock_adapter = MagicMock(name="mock_llm_adapter")
-    mock_adapter.system_prompt = ""  # Pydantic SpecialistTurnTrace expects str, not MagicMock
-    mock.create_adapter.return_value = mock_adapter
+    mock.create_adapter.return_value = make_mock_adapter()
     return mock
 
 
+@pytest.fixture
+def mock_llm_adapter() -> Mock:
+    """
+    A fresh mocked LLM adapter (see make_mock_adapter), for tests that build
+    their specialist by hand and bind the adapter themselves.
+    """
+    return make_mock_adapter()
+
+
+def _snake_case(class_name: str) -> str:
+    """'WebBuilder' -> 'web_builder' (module and default specialist name)."""
+    return "".join(
+        ["_" + i.lower() if i.isupper() else i for i in class_name]
+    ).lstrip("_")
+
+
+@lru_cache(maxsize=None)
+def _import_specialist_class(class_name: str) -> type:
+    """
+    Imports a specialist class from app.src.specialists.<snake_case module>.
+
+    Test modules go through this (via the fixtures below) rather than importing
+    specialist classes at module level, so collection doesn't load every
+    specialist and its dependencies up front.
+    """
+    module = importlib.import_module(f"app.src.specialists.{_snake_case(class_name)}")
+    return getattr(module, class_name)
+
+
+@pytest.fixture(scope="session")
+def specialist_registry():
+    """
+    A session-wide cache of bare specialist instances, built on first use:
+    specialist_registry("WebBuilder").
+
+    Instances are constructed with an empty config and no adapter or MCP
+    client. They are shared across modules, so the fixture handing one to a
+    test must reset whatever that test mutates (llm_adapter, mcp_client, ...).
+    Use initialized_specialist_factory when a test needs the mocked config.
+    """
+    cache = {}
+
+    def _get(class_name: str):
+        if class_name not in cache:
+            SpecialistClass = _import_specialist_class(class_name)
+            cache[class_name] = SpecialistClass(
+                specialist_name=_snake_case(class_name), specialist_config={}
+            )
+        return cache[class_name]
+
+    return _get
+
+
 @pytest.fixture
 def initialized_specialist_factory(
-    mock_config_loader: MagicMock, mock_adapter_factory: MagicMock
+    mock_config_loader: Mock, mock_adapter_factory: MagicMock
 ):
     """
     (ADR-TS-001, Task 1.3) A factory fixture to create initialized specialists.
@@ -167,16 +275,10 @@ def initialized_specialist_factory(
             An initialized instance of the specialist with mocked dependencies.
         """
         # Dynamically find and import the specialist module
-        module_name_snake = "".join(
-            ["_" + i.lower() if i.isupper() else i for i in class_name]
-        ).lstrip("_")
-        module = importlib.import_module(f"app.src.specialists.{module_name_snake}")
-        SpecialistClass = getattr(module, class_name)
+        SpecialistClass = _import_specialist_class(class_name)
 
         # Determine the specialist's name for config lookup
-        specialist_name = specialist_name_override or "".join(
-            ["_" + i.lower() if i.isupper() else i for i in class_name]
-        ).lstrip("_")
+        specialist_name = specialist_name_override or _snake_case(class_name)
 
         # Get the base config and apply any overrides
         specialist_config = (
@@ -213,6 +315,55 @@ def initialized_specialist_factory(
     return _factory
 
 
+@pytest.fixture(scope="session")
+def msg_factory():
+    """
+    A cached constructor for LangChain messages: msg_factory(HumanMessage, "Hi").
+
+    Each (class, content) pair is validated once per session and the instance is
+    reused afterwards, so only use it for messages the test does not mutate.
+    """
+    cache = {}
+
+    def _make(message_cls, content: str):
+        key = (message_cls, content)
+        if key not in cache:
+            cache[key] = message_cls(content=content)
+        return cache[key]
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def llm_response():
+    """
+    Canned adapter responses from assets/llm_responses.json, keyed like
+    "web_builder.html_hello". The file is parsed once per session; each call
+    returns a fresh deep copy so tests can't leak edits into one another.
+    """
+    responses_path = Path(__file__).parent / "assets" / "llm_responses.json"
+    responses = json.loads(responses_path.read_text())
+
+    def _get(key: str) -> dict:
+        return copy.deepcopy(responses[key])
+
+    return _get
+
+
+@pytest.fixture
+def default_state(msg_factory):
+    """
+    A minimal GraphState holding a single user message.
+
+    Shared here so specialist test modules don't each redeclare it. Each test
+    gets its own dict and messages list (specialists may append to it); the
+    message itself is the session-cached instance from msg_factory.
+    """
+    from langchain_core.messages import HumanMessage
+    from app.src.graph.state import GraphState
+    return GraphState(messages=[msg_factory(HumanMessage, "What should I do next?")])
+
+
 # =============================================================================
 # VALIDATION UTILITIES (Shared across live integration tests)
 # =============================================================================
@@ -1,4 +1,5 @@
-"""Test helpers for LAS integration tests."""
+"""Test helpers for LAS unit and integration tests."""
+from .fake_adapter import FakeAdapter, FailingAdapter, make_mock_adapter
 from .file_tree_builder import (
     folder_of_empty_files,
     folder_of_files_with_content,
@@ -8,6 +9,9 @@ from .file_tree_builder import (
 )
 
 __all__ = [
+    "FakeAdapter",
+    "FailingAdapter",
+    "make_mock_adapter",
     "folder_of_empty_files",
     "folder_of_files_with_content",
     "empty_folders",
@@ -0,0 +1,68 @@
+"""
+Lightweight LLM adapter stubs for specialist unit tests.
+
+Plain classes with only an invoke() method, for tests that only care about
+what the adapter returns (or raises) and what request it was sent. Cheaper
+than MagicMock, which builds child mocks and records full call arguments on
+every access.
+"""
+from typing import Any, List
+from unittest.mock import Mock
+
+# The adapter surface specialists actually touch. Everything else on a real
+# adapter is provider plumbing that specialists reach only through invoke().
+ADAPTER_SPEC = ["invoke", "model_name", "system_prompt"]
+
+
+class FakeAdapter:
+    """Adapter stub whose invoke() returns a canned response."""
+
+    model_name = "fake-model"
+    system_prompt = ""  # Pydantic SpecialistTurnTrace expects str
+
+    def __init__(self, response: Any = None):
+        self._response = response
+        self.requests: List[Any] = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.requests)
+
+    @property
+    def last_request(self) -> Any:
+        return self.requests[-1] if self.requests else None
+
+    def invoke(self, request: Any) -> Any:
+        self.requests.append(request)
+        return self._response
+
+
+class FailingAdapter:
+    """Adapter stub whose invoke() raises the given exception."""
+
+    model_name = "fake-model"
+    system_prompt = ""
+
+    def __init__(self, error: Exception):
+        self._error = error
+        self.requests: List[Any] = []
+
+    @property
+    def call_count(self) -> int:
+        return len(self.requests)
+
+    def invoke(self, request: Any) -> Any:
+        self.requests.append(request)
+        raise self._error
+
+
+def make_mock_adapter() -> Mock:
+    """
+    A Mock adapter for tests that need call assertions or side_effect
+    sequences. spec_set limits it to ADAPTER_SPEC, so it skips MagicMock's
+    magic-method setup and rejects misspelled attributes instead of
+    auto-creating them.
+    """
+    adapter = Mock(spec_set=ADAPTER_SPEC, name="mock_llm_adapter")
+    adapter.system_prompt = ""  # Pydantic SpecialistTurnTrace expects str
+    return adapter
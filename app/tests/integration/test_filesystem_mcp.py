@@ -26,6 +26,12 @@ from app.tests.helpers import (
 # LOCAL FIXTURES
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def workspace_root() -> Path:
+    """Resolved local workspace root, computed once per module."""
+    return Path("workspace").resolve()
+
+
 @pytest.fixture
 def test_folder():
     """Create unique test folder, cleanup after."""
@@ -34,6 +40,12 @@ def test_folder():
     cleanup_folder(folder)
 
 
+@pytest.fixture
+def test_folder_rel(test_folder, workspace_root) -> Path:
+    """test_folder relative to the workspace root (for helpers and MCP paths)."""
+    return test_folder.relative_to(workspace_root)
+
+
 # =============================================================================
 # Connection Tests
 # =============================================================================
@@ -71,11 +83,11 @@ async def test_filesystem_mcp_list_tools(connected_filesystem_client):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_list_directory(connected_filesystem_client, test_folder):
+async def test_list_directory(connected_filesystem_client, test_folder_rel):
     """Test list_directory returns file names."""
     # Create test files via native Python (test setup, not testing MCP write)
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {
             "alpha.txt": "content alpha",
             "bravo.txt": "content bravo",
@@ -83,7 +95,7 @@ async def test_list_directory(connected_filesystem_client, test_folder):
     )
 
     # MCP path uses /workspace mount (filesystem-mcp container mount point)
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}"
+    mcp_path = f"/workspace/{test_folder_rel}"
 
     result = await connected_filesystem_client.call_tool(
         "filesystem",
@@ -100,14 +112,14 @@ async def test_list_directory(connected_filesystem_client, test_folder):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_read_file(connected_filesystem_client, test_folder):
+async def test_read_file(connected_filesystem_client, test_folder_rel):
     """Test read_file returns file contents."""
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {"test_read.txt": "Hello from test file"}
     )
 
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}/test_read.txt"
+    mcp_path = f"/workspace/{test_folder_rel}/test_read.txt"
 
     result = await connected_filesystem_client.call_tool(
         "filesystem",
@@ -121,9 +133,9 @@ async def test_read_file(connected_filesystem_client, test_folder):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_write_file(connected_filesystem_client, test_folder):
+async def test_write_file(connected_filesystem_client, test_folder, test_folder_rel):
     """Test write_file creates file with content."""
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}/test_write.txt"
+    mcp_path = f"/workspace/{test_folder_rel}/test_write.txt"
 
     await connected_filesystem_client.call_tool(
         "filesystem",
@@ -142,13 +154,13 @@ async def test_write_file(connected_filesystem_client, test_folder):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_create_directory(connected_filesystem_client, test_folder):
+async def test_create_directory(connected_filesystem_client, test_folder, test_folder_rel):
     """Test create_directory creates a single directory.
 
     Note: Filesystem MCP doesn't support recursive mkdir.
     Parent directory must already exist.
     """
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}/newdir"
+    mcp_path = f"/workspace/{test_folder_rel}/newdir"
 
     await connected_filesystem_client.call_tool(
         "filesystem",
@@ -164,15 +176,15 @@ async def test_create_directory(connected_filesystem_client, test_folder):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_move_file(connected_filesystem_client, test_folder):
+async def test_move_file(connected_filesystem_client, test_folder, test_folder_rel):
     """Test move_file renames/moves files."""
     # Create source file
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {"source.txt": "Content to move"}
     )
 
-    base_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}"
+    base_path = f"/workspace/{test_folder_rel}"
 
     await connected_filesystem_client.call_tool(
         "filesystem",
@@ -191,14 +203,14 @@ async def test_move_file(connected_filesystem_client, test_folder):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_file_info(connected_filesystem_client, test_folder):
+async def test_get_file_info(connected_filesystem_client, test_folder_rel):
     """Test get_file_info returns metadata."""
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {"info_test.txt": "Some content"}
     )
 
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}/info_test.txt"
+    mcp_path = f"/workspace/{test_folder_rel}/info_test.txt"
 
     result = await connected_filesystem_client.call_tool(
         "filesystem",
@@ -230,7 +242,7 @@ async def test_get_file_info(connected_filesystem_client, test_folder):
 @pytest.mark.skip(reason="Sync bridge deadlocks in pytest-asyncio context (same-thread event loop)")
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_sync_bridge_list_directory(connected_filesystem_client, test_folder):
+async def test_sync_bridge_list_directory(connected_filesystem_client, test_folder_rel):
     """Test sync_call_external_mcp works (validates fix for GitHub #28).
 
     SKIPPED: Cannot test sync bridge from async test context.
@@ -240,11 +252,11 @@ async def test_sync_bridge_list_directory(connected_filesystem_client, test_fold
 
     # Create test files
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {"sync_test.txt": "sync bridge test content"}
     )
 
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}"
+    mcp_path = f"/workspace/{test_folder_rel}"
 
     # Call via sync bridge (this is what specialists use)
     result = sync_call_external_mcp(
@@ -261,7 +273,7 @@ async def test_sync_bridge_list_directory(connected_filesystem_client, test_fold
 @pytest.mark.skip(reason="Sync bridge deadlocks in pytest-asyncio context (same-thread event loop)")
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_sync_bridge_read_file(connected_filesystem_client, test_folder):
+async def test_sync_bridge_read_file(connected_filesystem_client, test_folder_rel):
     """Test sync bridge read_file operation.
 
     SKIPPED: Cannot test sync bridge from async test context.
@@ -270,11 +282,11 @@ async def test_sync_bridge_read_file(connected_filesystem_client, test_folder):
     from app.src.mcp.external_client import sync_call_external_mcp
 
     folder_of_files_with_content(
-        str(test_folder.relative_to(Path("workspace").resolve())),
+        str(test_folder_rel),
         {"sync_read.txt": "Hello from sync bridge"}
     )
 
-    mcp_path = f"/workspace/{test_folder.relative_to(Path('workspace').resolve())}/sync_read.txt"
+    mcp_path = f"/workspace/{test_folder_rel}/sync_read.txt"
 
     result = sync_call_external_mcp(
         connected_filesystem_client,
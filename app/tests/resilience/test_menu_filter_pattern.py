@@ -405,6 +405,7 @@ class TestRouterMenuFiltering:
 class TestLifecycleManagement:
     """Test forbidden list lifecycle (creation and clearance)."""
 
+    @pytest.mark.skip(reason="Not yet implemented: needs GraphOrchestrator integration test")
     def test_forbidden_list_cleared_after_non_router_execution(self):
         """
         REQUIREMENT: Forbidden list cleared after ANY successful specialist execution (non-router).
@@ -414,6 +415,7 @@ class TestLifecycleManagement:
         # Placeholder to document requirement
         pass
 
+    @pytest.mark.skip(reason="Not yet implemented: needs GraphOrchestrator integration test")
     def test_router_execution_does_not_clear_forbidden_list(self):
         """
         REQUIREMENT: Router specialist execution does NOT clear forbidden list.
@@ -651,6 +653,7 @@ class TestStateManagement:
         assert scratchpad.forbidden_specialists == ["file_ops_specialist"]
         assert scratchpad.loop_detection_reason == "Test loop detected"
 
+    @pytest.mark.skip(reason="Placeholder: enforced by the GraphState TypedDict reducer")
     def test_scratchpad_merge_semantics(self):
         """
         REQUIREMENT: Scratchpad uses operator.ior reducer (merge semantics).
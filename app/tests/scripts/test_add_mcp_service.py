@@ -15,6 +15,7 @@ import subprocess
 import tempfile
 import yaml
 from pathlib import Path
+from uuid import uuid4
 from unittest.mock import MagicMock, patch, call
 
 # Import the installer class
@@ -25,9 +26,18 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from scripts.add_mcp_service import McpServiceInstaller
 
 
+@pytest.fixture(scope="session")
+def workspace_root(tmp_path_factory):
+    """Single temp root shared by the session; tests get unique subdirs."""
+    return tmp_path_factory.mktemp("mcp_install_root")
+
+
 @pytest.fixture
-def temp_project_root(tmp_path):
+def temp_project_root(workspace_root):
     """Create temporary project structure for testing."""
+    tmp_path = workspace_root / f"ws_{uuid4().hex}"
+    tmp_path.mkdir()
+
     # Create directory structure
     config_dir = tmp_path / "config"
     config_dir.mkdir()
@@ -0,0 +1,481 @@
+"""
+Tests for the server control script's PID file handling (scripts/server.py).
+"""
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import psutil
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts import server
+
+
+def test_each_command_is_registered_once():
+    """Tests that no command is defined twice (a pasted copy would shadow the first)."""
+    names = [cmd.name or cmd.callback.__name__ for cmd in server.app.registered_commands]
+
+    assert sorted(names) == ["restart", "start", "status", "stop", "ui"]
+
+
+@pytest.fixture
+def pid_file(tmp_path, monkeypatch):
+    """Points the script at a PID file in a temp directory."""
+    path = tmp_path / "server.pid"
+    monkeypatch.setattr(server, "SERVER_PID_FILE", str(path))
+    return path
+
+
+def test_written_pid_file_identifies_running_process(pid_file):
+    """Tests that a PID file written by start() resolves back to the same process."""
+    server._write_pid_file(psutil.Process(os.getpid()))
+
+    proc = server._is_server_running()
+
+    assert proc is not None
+    assert proc.pid == os.getpid()
+
+
+def test_reused_pid_is_not_treated_as_server(pid_file):
+    """Tests that a live PID with a different start time is rejected."""
+    me = psutil.Process(os.getpid())
+    pid_file.write_text(f"{me.pid} {me.create_time() - 3600}")
+
+    assert server._is_server_running() is None
+    assert not pid_file.exists()
+
+
+def test_pid_file_records_pid_exe_and_start_time(pid_file):
+    """Tests that the PID file is a JSON record of everything that identifies the server."""
+    me = psutil.Process(os.getpid())
+    server._write_pid_file(me)
+
+    assert json.loads(pid_file.read_text()) == {
+        "pid": me.pid, "exe": me.exe(), "create_time": me.create_time(),
+    }
+
+
+def test_different_executable_is_not_treated_as_server(pid_file):
+    """Tests that a matching PID and start time running another program is rejected."""
+    me = psutil.Process(os.getpid())
+    pid_file.write_text(json.dumps({
+        "pid": me.pid, "exe": "/usr/bin/not-our-server", "create_time": me.create_time(),
+    }))
+
+    assert server._is_server_running() is None
+    assert not pid_file.exists()
+
+
+@pytest.mark.parametrize("content", [
+    "{pid}",  # Before start times were recorded
+    "{pid} {create_time}",  # Before the executable was recorded
+], ids=["pid_only", "pid_and_create_time"])
+def test_legacy_pid_files_are_checked_against_our_interpreter(pid_file, content):
+    """Tests that plain-text PID files still resolve a process running our python."""
+    me = psutil.Process(os.getpid())
+    pid_file.write_text(content.format(pid=me.pid, create_time=me.create_time()))
+
+    proc = server._is_server_running()
+
+    assert proc is not None
+    assert proc.pid == os.getpid()
+
+
+def test_unreadable_pid_file_is_removed(pid_file):
+    """Tests that a PID file with no usable PID is treated as stale."""
+    pid_file.write_text("")
+
+    assert server._is_server_running() is None
+    assert not pid_file.exists()
+
+
+def test_stale_pid_file_is_removed(pid_file):
+    """Tests that a PID file pointing at an exited process is cleaned up."""
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    pid_file.write_text(f"{exited.pid} 0.0")
+
+    assert server._is_server_running() is None
+    assert not pid_file.exists()
+
+
+class _CountingStream(io.StringIO):
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def test_buffered_handler_does_not_flush_per_record():
+    """Tests that control messages are written without a flush per record."""
+    stream = _CountingStream()
+    handler = server._BufferedStreamHandler(stream)
+    logger = logging.getLogger("test_server.buffered")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for line in range(3):
+            logger.warning(f"line {line}")
+    finally:
+        logger.removeHandler(handler)
+
+    assert stream.getvalue() == "line 0\nline 1\nline 2\n"
+    assert stream.flushes == 0
+    handler.flush()
+    assert stream.flushes == 1
+
+
+@pytest.fixture
+def dotenv_calls(monkeypatch):
+    """Records load_dotenv calls and resets the once-per-process cache."""
+    calls = []
+    monkeypatch.setattr("dotenv.load_dotenv", calls.append)
+    server._load_env_once.cache_clear()
+    yield calls
+    server._load_env_once.cache_clear()
+
+
+def test_status_and_stop_do_not_read_dotenv(pid_file, dotenv_calls):
+    """Tests that commands which launch nothing skip the .env file."""
+    server.status()
+    server.stop()
+
+    assert dotenv_calls == []
+
+
+def test_load_env_once_reads_dotenv_once(dotenv_calls):
+    """Tests that repeated launches (e.g. restart) parse .env only once."""
+    server._load_env_once()
+    server._load_env_once()
+
+    assert dotenv_calls == [os.path.join(server.PROJECT_ROOT, ".env")]
+
+
+@pytest.fixture
+def log_config(tmp_path, monkeypatch):
+    """Points the script at a YAML log config and a JSON copy in a temp directory."""
+    yaml_path = tmp_path / "log_config.yaml"
+    yaml_path.write_text("version: 1\nroot:\n  level: DEBUG  # comment\n")
+    monkeypatch.setattr(server, "LOG_CONFIG_FILE", str(yaml_path))
+    monkeypatch.setattr(server, "COMPILED_LOG_CONFIG_FILE", str(tmp_path / "run" / "log_config.json"))
+    return yaml_path
+
+
+def test_compiled_log_config_matches_yaml(log_config):
+    """Tests that Uvicorn is handed a JSON copy of the YAML log config."""
+    path = server._compiled_log_config()
+
+    assert path.endswith(".json")
+    with open(path) as f:
+        assert json.load(f) == {"version": 1, "root": {"level": "DEBUG"}}
+
+
+def test_compiled_log_config_is_reused_until_yaml_changes(log_config, monkeypatch):
+    """Tests that the YAML is parsed again only after it is edited."""
+    path = server._compiled_log_config()
+
+    def fail(*args):
+        raise AssertionError("log_config.yaml was parsed again")
+    with monkeypatch.context() as m:
+        m.setattr("yaml.safe_load", fail)
+        assert server._compiled_log_config() == path
+
+    log_config.write_text("version: 1\nroot:\n  level: INFO\n")
+    newer = os.path.getmtime(path) + 10
+    os.utime(log_config, (newer, newer))
+    with open(server._compiled_log_config()) as f:
+        assert json.load(f)["root"]["level"] == "INFO"
+
+
+@pytest.fixture
+def listening_port(monkeypatch):
+    """Points the script at a local port that accepts connections."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        monkeypatch.setattr(server, "PORT", sock.getsockname()[1])
+        yield sock
+
+
+@pytest.fixture
+def sleeper():
+    """A live child process standing in for the server."""
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+def test_wait_for_startup_returns_when_port_opens(listening_port, sleeper, monkeypatch):
+    """Tests that the health check ends once the server port accepts connections."""
+    monkeypatch.setattr(server, "STARTUP_WINDOW_S", 10.0)
+
+    started = time.monotonic()
+    server._wait_for_startup(sleeper)
+
+    assert time.monotonic() - started < 5.0
+
+
+def test_wait_for_startup_returns_when_process_exits(monkeypatch):
+    """Tests that the health check ends as soon as the server process dies."""
+    monkeypatch.setattr(server, "STARTUP_WINDOW_S", 10.0)
+    failing = subprocess.Popen([sys.executable, "-c", "raise SystemExit(1)"])
+
+    started = time.monotonic()
+    server._wait_for_startup(failing)
+
+    assert failing.poll() == 1
+    assert time.monotonic() - started < 5.0
+
+
+def test_wait_for_startup_ignores_port_held_before_launch(listening_port, sleeper, monkeypatch):
+    """Tests that a port busy before launch doesn't count as our server being up."""
+    monkeypatch.setattr(server, "STARTUP_WINDOW_S", 0.5)
+
+    started = time.monotonic()
+    server._wait_for_startup(sleeper, wait_full_window=True)
+
+    assert time.monotonic() - started >= 0.5
+
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="stop() signals PIDs directly on POSIX only")
+
+
+@posix_only
+def test_spawn_server_captures_output_and_exit_code(tmp_path, monkeypatch):
+    """Tests that a posix_spawn'd child runs in the project root with its output piped back."""
+    monkeypatch.chdir(tmp_path)  # _spawn_server changes our cwd; restore it afterwards
+    command = [sys.executable, "-c",
+               "import os, sys; print(os.getcwd()); print('boom', file=sys.stderr); sys.exit(3)"]
+
+    process = server._spawn_server(command, env=dict(os.environ))
+    process.wait()
+    output = server._read_startup_output(process)
+
+    assert process.poll() == 3
+    assert output.split() == [server.PROJECT_ROOT, "boom"]
+    assert process.stdout.closed
+
+
+@posix_only
+@pytest.mark.parametrize("printed", ["failed", ""], ids=["with_output", "no_output"])
+def test_read_startup_output_does_not_wait_on_pipe_held_by_another_process(printed):
+    """Tests that output is collected even if a leftover child keeps the pipe open."""
+    process = subprocess.Popen(
+        [sys.executable, "-c",
+         f"import subprocess, sys; print({printed!r}, end='', flush=True); "
+         "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    process.wait()
+
+    started = time.monotonic()
+    output = server._read_startup_output(process)
+
+    assert output == printed
+    assert process.stdout.closed
+    assert time.monotonic() - started < 5.0
+
+
+def test_read_startup_output_without_set_blocking(monkeypatch):
+    """Tests the blocking fallback for Pythons without os.set_blocking (Windows < 3.12)."""
+    monkeypatch.delattr(os, "set_blocking")
+    process = subprocess.Popen(
+        [sys.executable, "-c", "print('failed', end='')"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    process.wait()
+
+    assert server._read_startup_output(process) == "failed"
+    assert process.stdout.closed
+
+
+@posix_only
+def test_spawned_server_detaches_into_new_session(tmp_path, monkeypatch):
+    """Tests that the spawned server no longer shares our session (setsid)."""
+    monkeypatch.chdir(tmp_path)
+    process = server._spawn_server(
+        [sys.executable, "-c", "import time; time.sleep(30)"], env=dict(os.environ)
+    )
+    try:
+        assert process.poll() is None
+        assert os.getsid(process.pid) == process.pid
+    finally:
+        os.kill(process.pid, signal.SIGKILL)
+        process.wait()
+        process.stdout.close()
+
+
+has_pidfd = pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfds need Linux 5.3+")
+
+
+@pytest.fixture(params=[
+    pytest.param("pidfd", marks=has_pidfd),
+    "pid",  # Kernels or platforms without pidfds
+])
+def signal_path(request, monkeypatch):
+    """Runs a stop() test through the pidfd path and the plain-PID fallback."""
+    if request.param == "pid":
+        monkeypatch.setattr(server, "_open_pidfd", lambda pid: None)
+    return request.param
+
+
+@posix_only
+def test_stop_terminates_server_and_removes_pid_file(pid_file, sleeper, signal_path, caplog):
+    """Tests that stop() SIGTERMs the recorded server, reaps it, and cleans up."""
+    server._write_pid_file(psutil.Process(sleeper.pid))
+
+    with caplog.at_level("INFO"):
+        server.stop()
+
+    assert "Server stopped gracefully." in caplog.messages
+    assert not psutil.pid_exists(sleeper.pid)
+    assert not pid_file.exists()
+
+
+@posix_only
+def test_stop_kills_server_that_ignores_sigterm(pid_file, signal_path, monkeypatch, caplog):
+    """Tests that stop() falls back to SIGKILL once STOP_TIMEOUT_S passes."""
+    monkeypatch.setattr(server, "STOP_TIMEOUT_S", 0.3)
+    stubborn = subprocess.Popen(
+        [sys.executable, "-c",
+         "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(30)"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    assert stubborn.stdout.readline().strip() == "ready"
+    stubborn.stdout.close()
+    server._write_pid_file(psutil.Process(stubborn.pid))
+
+    with caplog.at_level("INFO"):
+        server.stop()
+
+    assert "Server terminated." in caplog.messages
+    assert not psutil.pid_exists(stubborn.pid)
+    assert not pid_file.exists()
+
+
+@posix_only
+@has_pidfd
+def test_stop_does_not_signal_process_that_replaced_server(sleeper, caplog):
+    """Tests that a PID handed to another process after verification is left alone."""
+    verified = psutil.Process(sleeper.pid)
+    # Stands in for the verified server having exited and its PID being reused
+    verified.is_running = lambda: False
+
+    with caplog.at_level("INFO"):
+        server._stop_with_signals(verified)
+
+    assert "Process already stopped." in caplog.messages
+    assert sleeper.poll() is None
+
+
+@pytest.fixture
+def stats_file(tmp_path, monkeypatch):
+    """Points the script at a stats file in a temp directory."""
+    path = tmp_path / "server_stats.json"
+    monkeypatch.setattr(server, "SERVER_STATS_FILE", str(path))
+    return path
+
+
+def _write_stats(path, proc, age_s=0.0, pid_offset=0, create_time_offset=0.0):
+    """Writes a snapshot as the server's publisher would, with optional mismatches."""
+    path.write_text(json.dumps({
+        "pid": proc.pid + pid_offset, "create_time": proc.create_time() + create_time_offset,
+        "cpu_percent": 12.5, "rss": 64 * 1024 * 1024,
+        "interval": 2.0, "updated_at": time.time() - age_s,
+    }))
+
+
+@pytest.mark.parametrize("age_s", [0.0, 4.0], ids=["just_published", "within_two_intervals"])
+def test_status_reports_fresh_published_stats(pid_file, stats_file, caplog, age_s):
+    """Tests that status uses the server's own snapshot when it is fresh."""
+    me = psutil.Process(os.getpid())
+    server._write_pid_file(me)
+    _write_stats(stats_file, me, age_s=age_s)
+
+    with caplog.at_level("INFO"):
+        server.status()
+
+    assert "  - CPU: 12.5% (last 2s)" in caplog.messages
+    assert "  - Memory: 64.00 MB" in caplog.messages
+
+
+@pytest.mark.parametrize("stats_kwargs", [
+    {"age_s": 6.0},  # Missed two 2 s intervals plus slack: server stopped publishing
+    {"pid_offset": 1},  # Snapshot from a different server process
+    {"create_time_offset": -3600},  # Earlier server that had the same PID
+], ids=["stale", "other_pid", "other_create_time"])
+def test_status_falls_back_to_live_stats(pid_file, stats_file, caplog, stats_kwargs):
+    """Tests that status ignores snapshots it can't trust and queries the process."""
+    me = psutil.Process(os.getpid())
+    server._write_pid_file(me)
+    _write_stats(stats_file, me, **stats_kwargs)
+
+    with caplog.at_level("INFO"):
+        server.status()
+
+    assert any("(average since start)" in m for m in caplog.messages)
+
+
+def test_status_ignores_published_stats_with_legacy_pid_file(pid_file, stats_file):
+    """Tests that a PID file without a start time can't vouch for a snapshot."""
+    me = psutil.Process(os.getpid())
+    pid_file.write_text(str(me.pid))
+    _write_stats(stats_file, me)
+
+    assert server._read_published_stats() is None
+
+
+@posix_only
+def test_published_stats_for_pid_owned_by_another_user_are_ignored(pid_file, stats_file, monkeypatch):
+    """Tests that a snapshot whose PID now belongs to someone else (EPERM) isn't trusted."""
+    me = psutil.Process(os.getpid())
+    server._write_pid_file(me)
+    _write_stats(stats_file, me)
+
+    def kill_owned_by_other_user(pid, sig):
+        raise PermissionError(1, "Operation not permitted")
+    monkeypatch.setattr(os, "kill", kill_owned_by_other_user)
+
+    assert server._read_published_stats() is None
+
+
+@posix_only
+def test_status_reports_killed_server_as_stopped(pid_file, stats_file, sleeper, caplog):
+    """Tests that a fresh snapshot left by a SIGKILLed server isn't reported as running."""
+    killed = psutil.Process(sleeper.pid)
+    server._write_pid_file(killed)
+    _write_stats(stats_file, killed)
+    sleeper.kill()
+    sleeper.wait()
+
+    with caplog.at_level("INFO"):
+        server.status()
+
+    assert "Server is STOPPED." in caplog.messages
+    assert not any("RUNNING" in m for m in caplog.messages)
+
+
+@posix_only
+def test_restart_starts_as_soon_as_old_server_exits(pid_file, sleeper, monkeypatch):
+    """Tests that restart() launches the new server right after the old one is gone."""
+    server._write_pid_file(psutil.Process(sleeper.pid))
+    old_server_alive_at_start = []
+    monkeypatch.setattr(server, "start", lambda: old_server_alive_at_start.append(psutil.pid_exists(sleeper.pid)))
+
+    started = time.monotonic()
+    server.restart()
+
+    assert old_server_alive_at_start == [False]
+    assert time.monotonic() - started < 1.0
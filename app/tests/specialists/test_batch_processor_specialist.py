@@ -8,7 +8,6 @@ import pytest
 from unittest.mock import MagicMock, patch
 from langchain_core.messages import HumanMessage, AIMessage
 
-from app.src.specialists.batch_processor_specialist import BatchProcessorSpecialist
 from app.src.specialists.schemas._file_operations import FileOperation
 from app.src.dispatchers import OperationResult
 
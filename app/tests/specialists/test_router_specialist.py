@@ -10,7 +10,11 @@ import pytest
 from unittest.mock import MagicMock
 from langchain_core.messages import HumanMessage
 
-from app.src.specialists.router_specialist import RouterSpecialist
+
+# Routing never mutates the incoming messages, so tests share these instances
+# (each state still gets its own list).
+SOME_REQUEST = HumanMessage(content="Some request")
+RESEARCH_QUERY = HumanMessage(content="Research query")
 
 
 @pytest.fixture
@@ -100,7 +104,7 @@ def test_get_available_specialists_with_menu_filter(router_specialist):
     - Hard constraint (P=0) - specialist cannot be selected
     """
     state = {
-        "messages": [HumanMessage(content="Some request")],
+        "messages": [SOME_REQUEST],
         "artifacts": {},
         "scratchpad": {
             "forbidden_specialists": ["researcher_specialist"]
@@ -127,7 +131,7 @@ def test_get_available_specialists_combined_filters(router_specialist):
     - Only researcher_specialist should remain
     """
     state = {
-        "messages": [HumanMessage(content="Some request")],
+        "messages": [SOME_REQUEST],
         "artifacts": {
             "gathered_context": {"actions_executed": []}
         },
@@ -157,7 +161,7 @@ def test_get_available_specialists_empty_gathered_context(router_specialist):
     - Only non-empty gathered_context triggers exclusion
     """
     state = {
-        "messages": [HumanMessage(content="Some request")],
+        "messages": [SOME_REQUEST],
         "artifacts": {
             "gathered_context": {}  # Empty - won't trigger exclusion
         }
@@ -183,7 +187,7 @@ def test_get_available_specialists_no_scratchpad(router_specialist):
     - No menu filter applied
     """
     state = {
-        "messages": [HumanMessage(content="Some request")],
+        "messages": [SOME_REQUEST],
         "artifacts": {}
         # No scratchpad key
     }
@@ -203,7 +207,7 @@ def test_get_available_specialists_logging(router_specialist, caplog):
     - Should log info message about planning specialists removal
     """
     state = {
-        "messages": [HumanMessage(content="Some request")],
+        "messages": [SOME_REQUEST],
         "artifacts": {
             "gathered_context": {"actions_executed": []}
         }
@@ -237,16 +241,13 @@ def test_recommendation_filtering_with_gathered_context(router_specialist):
     def mock_invoke(request):
         captured_prompts.append(request.messages[-1].content)
         return {
-            "tool_calls": [{
-                "name": "Route",
-                "args": {"next_specialist": "chat_specialist"}
-            }]
+            "json_response": {"next_specialist": ["chat_specialist"]}
         }
 
     router_specialist.llm_adapter.invoke = mock_invoke
 
     state = {
-        "messages": [HumanMessage(content="Research query")],
+        "messages": [RESEARCH_QUERY],
         "artifacts": {
             "gathered_context": {"actions_executed": []}
         },
@@ -279,16 +280,13 @@ def test_all_recommendations_filtered_out(router_specialist, caplog):
     # Mock LLM adapter
     def mock_invoke(request):
         return {
-            "tool_calls": [{
-                "name": "Route",
-                "args": {"next_specialist": "chat_specialist"}
-            }]
+            "json_response": {"next_specialist": ["chat_specialist"]}
         }
 
     router_specialist.llm_adapter.invoke = mock_invoke
 
     state = {
-        "messages": [HumanMessage(content="Research query")],
+        "messages": [RESEARCH_QUERY],
         "artifacts": {
             "gathered_context": {"actions_executed": []}
         },
@@ -321,16 +319,13 @@ def test_context_gathering_complete_note_in_prompt(router_specialist):
     def mock_invoke(request):
         captured_prompts.append(request.messages[-1].content)
         return {
-            "tool_calls": [{
-                "name": "Route",
-                "args": {"next_specialist": "chat_specialist"}
-            }]
+            "json_response": {"next_specialist": ["chat_specialist"]}
         }
 
     router_specialist.llm_adapter.invoke = mock_invoke
 
     state = {
-        "messages": [HumanMessage(content="Research query")],
+        "messages": [RESEARCH_QUERY],
         "artifacts": {
             "gathered_context": {"actions_executed": []}
         },
@@ -360,10 +355,7 @@ def test_triage_recommendations_included_in_router_prompt(router_specialist):
     def mock_invoke(request):
         captured_prompts.append(request.messages[-1].content)
         return {
-            "tool_calls": [{
-                "name": "Route",
-                "args": {"next_specialist": "researcher_specialist"}
-            }]
+            "json_response": {"next_specialist": ["researcher_specialist"]}
         }
 
     router_specialist.llm_adapter.invoke = mock_invoke
@@ -403,10 +395,7 @@ def test_researcher_specialist_recommended_for_web_search(router_specialist):
     def mock_invoke(request):
         captured_prompts.append(request.messages[-1].content)
         return {
-            "tool_calls": [{
-                "name": "Route",
-                "args": {"next_specialist": "researcher_specialist"}
-            }]
+            "json_response": {"next_specialist": ["researcher_specialist"]}
         }
 
     router_specialist.llm_adapter.invoke = mock_invoke
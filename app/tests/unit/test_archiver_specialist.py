@@ -2,7 +2,6 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock, mock_open, ANY
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
-from app.src.specialists.archiver_specialist import ArchiverSpecialist
 from app.src.graph.state_factory import create_test_state
 
 @pytest.fixture
@@ -7,6 +7,7 @@ from langchain_core.messages import AIMessage
 from app.src.workflow.graph_orchestrator import GraphOrchestrator
 from app.src.specialists.end_specialist import EndSpecialist
 from app.src.enums import CoreSpecialist
+from app.tests.helpers import FakeAdapter
 
 @pytest.fixture
 def orchestrator_instance():
@@ -147,9 +148,7 @@ def test_sa_validation_failure_preserves_raw_response():
     }
 
     sa = SystemsArchitect("systems_architect", {"type": "structured"})
-    sa.llm_adapter = MagicMock()
-    sa.llm_adapter.invoke.return_value = {"json_response": raw_response}
-    sa.llm_adapter.model_name = "test-model"
+    sa.llm_adapter = FakeAdapter({"json_response": raw_response})
 
     from langchain_core.messages import HumanMessage
     state = {
@@ -185,8 +184,7 @@ def test_end_specialist_generates_clarification_response():
     end_specialist = EndSpecialist("end_specialist", mock_config)
 
     # Mock the LLM adapter to ensure it's NOT called for synthesis
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.invoke.return_value = {"text_response": "Synthesized response"}
+    end_specialist.llm_adapter = FakeAdapter({"text_response": "Synthesized response"})
 
     # Mock the archiver to prevent actual file operations
     end_specialist.archiver = MagicMock()
@@ -222,5 +220,5 @@ def test_end_specialist_generates_clarification_response():
     assert "- Is this for production?" in content
     
     # 3. Verify LLM synthesis was NOT called
-    end_specialist.llm_adapter.invoke.assert_not_called()
+    assert end_specialist.llm_adapter.call_count == 0
 
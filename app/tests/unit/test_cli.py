@@ -15,41 +15,39 @@ def mock_requests():
     with patch("app.src.cli.requests.post") as mock_post:
         yield mock_post
 
-def test_cli_invoke_success(mock_requests):
+@pytest.fixture(scope="module")
+def make_mock_response():
+    """Factory for a mocked non-streaming `requests.post` response."""
+    def _make(payload: dict, status_code: int = 200) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        return response
+    return _make
+
+SUCCESS_PAYLOAD = {"final_output": {"artifacts": {"final_user_response.md": "Success!"}}}
+
+@pytest.mark.parametrize("extra_args, expected_in, expected_not_in", [
+    ([], ["Agent Final Response", "Success!"], []),
+    # --json-only suppresses messages and prints just the JSON
+    (["--json-only"], ['"final_user_response.md": "Success!"'], ["Agent Final Response"]),
+], ids=["default", "json_only"])
+def test_cli_invoke_success(mock_requests, make_mock_response, extra_args, expected_in, expected_not_in):
     """Tests the 'invoke' command with a successful API response."""
     # Arrange
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "final_output": {"artifacts": {"final_user_response.md": "Success!"}}
-    }
-    mock_requests.return_value = mock_response
+    mock_requests.return_value = make_mock_response(SUCCESS_PAYLOAD)
 
     # Act
-    result = runner.invoke(app, ["invoke", "test prompt"])
+    result = runner.invoke(app, ["invoke", "test prompt", *extra_args])
 
     # Assert
     assert result.exit_code == 0
-    assert "Agent Final Response" in result.stdout
-    assert "Success!" in result.stdout
+    for text in expected_in:
+        assert text in result.stdout
+    for text in expected_not_in:
+        assert text not in result.stdout
     mock_requests.assert_called_once()
 
-def test_cli_invoke_json_only(mock_requests):
-    """Tests the 'invoke' command with the --json-only flag."""
-    # Arrange
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"final_output": {"artifacts": {"final_user_response.md": "Success!"}}}
-    mock_requests.return_value = mock_response
-
-    # Act
-    result = runner.invoke(app, ["invoke", "test prompt", "--json-only"])
-
-    # Assert
-    assert result.exit_code == 0
-    assert "Agent Final Response" not in result.stdout # Suppressed messages
-    assert '"final_user_response.md": "Success!"' in result.stdout # Just the JSON
-
 def test_cli_stream_success(mock_requests):
     """Tests the 'stream' command with a successful streaming response."""
     # Arrange
@@ -71,13 +69,12 @@ def test_cli_stream_success(mock_requests):
     # The final JSON is always printed for scripting, with the prefix stripped
     assert result.stdout.strip().endswith('{"status": "stream complete", "artifacts": {"final_user_response.md": "Success!"}}')
 
-def test_cli_invoke_api_non_200_response(mock_requests):
+def test_cli_invoke_api_non_200_response(mock_requests, make_mock_response):
     """Tests how the CLI handles a non-200 status code from the API."""
     # Arrange
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_response.json.return_value = {"final_output": {"error_report": "Internal Server Error"}}
-    mock_requests.return_value = mock_response
+    mock_requests.return_value = make_mock_response(
+        {"final_output": {"error_report": "Internal Server Error"}}, status_code=500
+    )
 
     # Act
     result = runner.invoke(app, ["invoke", "test prompt"])
@@ -24,6 +24,7 @@ import pytest
 from langchain_core.messages import HumanMessage, AIMessage
 
 from app.src.utils.cancellation_manager import CancellationManager
+from app.tests.helpers import make_mock_adapter
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -161,7 +162,7 @@ class TestCancellationManagerConcurrency:
 
 def _make_mock_adapter(response_text="Test response"):
     """Create a mock LLM adapter that returns the specified text."""
-    adapter = MagicMock()
+    adapter = make_mock_adapter()
     adapter.system_prompt = "You are a test specialist."
     adapter.model_name = "test-model"
     adapter.invoke.return_value = {"text_response": response_text}
@@ -356,7 +357,7 @@ class TestOutputIsolation:
             last_content = messages[-1].content if messages else "unknown"
             return {"text_response": f"Response to: {last_content}"}
 
-        mock_adapter = MagicMock()
+        mock_adapter = make_mock_adapter()
         mock_adapter.system_prompt = "test"
         mock_adapter.model_name = "test-model"
         mock_adapter.invoke.side_effect = mock_invoke
@@ -907,7 +908,7 @@ class TestCascadeCancellation:
         specialist = MagicMock()
         specialist.specialist_name = "test_specialist"
         specialist.specialist_config = {"type": "llm"}
-        specialist.llm_adapter = MagicMock()
+        specialist.llm_adapter = make_mock_adapter()
         specialist.llm_adapter.system_prompt = "test"
         specialist.llm_adapter.model_name = "test-model"
         specialist.execute.return_value = {
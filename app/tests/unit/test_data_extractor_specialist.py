@@ -2,8 +2,8 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
-from app.src.specialists.data_extractor_specialist import DataExtractorSpecialist
 from app.src.utils.errors import LLMInvocationError
+from app.tests.helpers import FakeAdapter
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 @pytest.fixture
@@ -49,13 +49,13 @@ def test_data_extractor_fallback_to_message_content(data_extractor_specialist):
         "artifacts": {"text_to_process": None}
     }
     mock_json_response = {"extracted_json": {"name": "Jane", "email": "jane@test.com"}}
-    data_extractor_specialist.llm_adapter.invoke.return_value = {"json_response": mock_json_response}
+    data_extractor_specialist.llm_adapter = FakeAdapter({"json_response": mock_json_response})
 
     # Act
     result_state = data_extractor_specialist._execute_logic(initial_state)
 
     # Assert - LLM should be called with the message content
-    data_extractor_specialist.llm_adapter.invoke.assert_called_once()
+    assert data_extractor_specialist.llm_adapter.call_count == 1
     assert "extracted_data" in result_state["artifacts"]
     assert result_state["artifacts"]["extracted_data"] == {"name": "Jane", "email": "jane@test.com"}
 
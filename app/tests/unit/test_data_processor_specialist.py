@@ -2,7 +2,6 @@ import pytest
 import json
 from unittest.mock import MagicMock, patch
 from langchain_core.messages import AIMessage, HumanMessage
-from app.src.specialists.data_processor_specialist import DataProcessorSpecialist
 
 @pytest.fixture
 def data_processor_specialist(initialized_specialist_factory):
@@ -1,8 +1,8 @@
 import pytest
 from unittest.mock import MagicMock, ANY
 from langchain_core.messages import AIMessage, HumanMessage
-from app.src.specialists.default_responder_specialist import DefaultResponderSpecialist
 from app.src.llm.adapter import StandardizedLLMRequest
+from app.tests.helpers import FakeAdapter
 
 @pytest.fixture
 def default_responder_specialist(initialized_specialist_factory):
@@ -47,10 +47,10 @@ def test_default_responder_generates_response_and_completes_task(default_respond
 def test_default_responder_handles_empty_llm_response(default_responder_specialist):
     """Tests that the specialist provides a fallback message if LLM returns empty."""
     # Arrange
-    default_responder_specialist.llm_adapter.invoke.return_value = {
+    default_responder_specialist.llm_adapter = FakeAdapter({
         "text_response": "",
         "raw_response_content": "LLM returned nothing useful."
-    }
+    })
 
     initial_state = {"messages": [HumanMessage(content="Say something.")]}
 
@@ -58,7 +58,7 @@ def test_default_responder_handles_empty_llm_response(default_responder_speciali
     result_state = default_responder_specialist._execute_logic(initial_state)
 
     # Assert
-    default_responder_specialist.llm_adapter.invoke.assert_called_once()
+    assert default_responder_specialist.llm_adapter.call_count == 1
     assert "messages" in result_state
     assert len(result_state["messages"]) == 1
     assert isinstance(result_state["messages"][0], AIMessage)
@@ -4,11 +4,11 @@ Tests for EndSpecialist after refactoring to hybrid coordinator.
 EndSpecialist now performs synthesis inline using its own LLM adapter
 rather than delegating to a separate ResponseSynthesizerSpecialist.
 """
-from unittest.mock import MagicMock, ANY, patch
+from unittest.mock import ANY, patch
 import pytest
-from app.src.specialists.end_specialist import EndSpecialist
 from langchain_core.messages import AIMessage, ToolMessage
 from app.src.specialists.archiver_specialist import ArchiverSpecialist
+from app.tests.helpers import FakeAdapter
 
 
 @pytest.fixture
@@ -50,9 +50,7 @@ def test_end_specialist_orchestrates_synthesis_and_archiving(end_specialist):
 
     # Mock the LLM adapter's invoke method (for synthesis)
     mock_llm_response = {"text_response": "Synthesized: snippet 1\n\nsnippet 2"}
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.invoke.return_value = mock_llm_response
-    end_specialist.llm_adapter.model_name = "mock-model"
+    end_specialist.llm_adapter = FakeAdapter(mock_llm_response)
 
     # Mock the archiver's _execute_logic (already patched by conftest)
     with patch.object(end_specialist.archiver, '_execute_logic') as mock_archive:
@@ -63,7 +61,7 @@ def test_end_specialist_orchestrates_synthesis_and_archiving(end_specialist):
 
         # Assert
         # 1. LLM adapter was called for synthesis
-        end_specialist.llm_adapter.invoke.assert_called_once()
+        assert end_specialist.llm_adapter.call_count == 1
 
         # 2. Archiver was called
         mock_archive.assert_called_once()
@@ -89,8 +87,7 @@ def test_end_specialist_skips_synthesis_if_final_response_exists(end_specialist)
     }
 
     # Mock LLM adapter
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.model_name = "mock-model"
+    end_specialist.llm_adapter = FakeAdapter()
 
     with patch.object(end_specialist.archiver, '_execute_logic') as mock_archive:
         mock_archive.return_value = {"artifacts": {"archive_report.md": "report"}}
@@ -100,7 +97,7 @@ def test_end_specialist_skips_synthesis_if_final_response_exists(end_specialist)
 
         # Assert
         # LLM adapter should NOT be called (synthesis skipped)
-        end_specialist.llm_adapter.invoke.assert_not_called()
+        assert end_specialist.llm_adapter.call_count == 0
 
         # Archiver should still be called
         mock_archive.assert_called_once()
@@ -125,9 +122,7 @@ def test_end_specialist_synthesizes_from_snippets(end_specialist):
 
     # Mock LLM response
     mock_llm_response = {"text_response": "Combined: First, Second, and Third pieces"}
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.invoke.return_value = mock_llm_response
-    end_specialist.llm_adapter.model_name = "mock-model"
+    end_specialist.llm_adapter = FakeAdapter(mock_llm_response)
 
     with patch.object(end_specialist.archiver, '_execute_logic') as mock_archive:
         mock_archive.return_value = {"artifacts": {"archive_report.md": "report"}}
@@ -137,8 +132,7 @@ def test_end_specialist_synthesizes_from_snippets(end_specialist):
 
         # Assert
         # LLM was called with concatenated snippets
-        call_args = end_specialist.llm_adapter.invoke.call_args
-        request = call_args[0][0]
+        request = end_specialist.llm_adapter.last_request
         message_content = request.messages[0].content
         assert "First piece" in message_content
         assert "Second piece" in message_content
@@ -160,8 +154,7 @@ def test_end_specialist_handles_empty_snippets_gracefully(end_specialist):
         "artifacts": {}
     }
 
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.model_name = "mock-model"
+    end_specialist.llm_adapter = FakeAdapter()
 
     with patch.object(end_specialist.archiver, '_execute_logic') as mock_archive:
         mock_archive.return_value = {"artifacts": {"archive_report.md": "report"}}
@@ -194,8 +187,7 @@ def test_end_specialist_handles_termination_reason(end_specialist):
         "artifacts": {}
     }
 
-    end_specialist.llm_adapter = MagicMock()
-    end_specialist.llm_adapter.model_name = "mock-model"
+    end_specialist.llm_adapter = FakeAdapter()
 
     with patch.object(end_specialist.archiver, '_execute_logic') as mock_archive:
         mock_archive.return_value = {"artifacts": {"archive_report.md": "report"}}
@@ -205,7 +197,7 @@ def test_end_specialist_handles_termination_reason(end_specialist):
 
         # Assert
         # Should use termination_reason directly, not call LLM
-        end_specialist.llm_adapter.invoke.assert_not_called()
+        assert end_specialist.llm_adapter.call_count == 0
 
         # Termination reason should be in final response
         state_for_archiver = mock_archive.call_args[0][0]
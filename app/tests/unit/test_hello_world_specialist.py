@@ -2,7 +2,6 @@ import pytest
 from unittest.mock import MagicMock
 from langchain_core.messages import AIMessage, HumanMessage
 # Assuming SpecialistNode is BaseSpecialist or compatible for instantiation
-from app.src.specialists.hello_world_specialist import HelloWorldSpecialist
 from app.src.graph.state import GraphState # Assuming GraphState is available
 
 @pytest.fixture
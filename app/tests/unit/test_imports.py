@@ -2,6 +2,9 @@
 import pytest
 import pkgutil
 import importlib
+import subprocess
+import sys
+from pathlib import Path
 import app.src.specialists
 
 def get_all_modules(package):
@@ -37,3 +40,41 @@ def test_import_all_modules(module_name):
         importlib.import_module(module_name)
     except ImportError as e:
         pytest.fail(f"Failed to import module '{module_name}': {e}")
+
+
+# Modules that must import without loading the google-genai SDK (~1s cold).
+# GeminiAdapter defers that import until an adapter is actually constructed.
+GENAI_FREE_MODULES = [
+    "app.src.llm.gemini_adapter",
+    "app.src.llm.adapters_helpers",
+    "app.src.specialists.router_specialist",
+    "app.src.specialists.prompt_specialist",
+]
+
+# GeminiWebUIAdapter defers playwright.sync_api until it launches a browser.
+PLAYWRIGHT_FREE_MODULES = [
+    "app.src.llm.gemini_webui_adapter",
+]
+
+@pytest.mark.parametrize("modules, heavy_module", [
+    (GENAI_FREE_MODULES, "google.genai"),
+    (PLAYWRIGHT_FREE_MODULES, "playwright.sync_api"),
+], ids=["google_genai", "playwright"])
+def test_modules_do_not_eagerly_import_heavy_sdks(modules, heavy_module):
+    """
+    Importing these modules must not pull in the SDK they defer. Checked in
+    a fresh interpreter, since this test process may already have it loaded.
+    """
+    project_root = Path(__file__).resolve().parents[3]
+    code = (
+        "import importlib, sys\n"
+        f"for name in {modules!r}:\n"
+        "    importlib.import_module(name)\n"
+        f"print({heavy_module!r} in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
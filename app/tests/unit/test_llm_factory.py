@@ -1,7 +1,7 @@
 # app/tests/unit/test_llm_factory.py
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 from app.src.llm.factory import AdapterFactory
 from app.src.llm.adapters import GeminiAdapter, LocalInferenceAdapter
 
@@ -47,43 +47,33 @@ def adapter_factory(mock_full_config):
     """Provides an AdapterFactory instance initialized with mock config."""
     return AdapterFactory(mock_full_config)
 
-@patch('app.src.llm.adapters.GeminiAdapter.from_config')
-def test_factory_creates_adapter_for_llm_specialist(mock_from_config, adapter_factory):
-    """Tests that an adapter is correctly created for a specialist of type 'llm'."""
-    mock_from_config.return_value = MagicMock(spec=GeminiAdapter)
-    adapter = adapter_factory.create_adapter("llm_specialist", "system prompt")
-    assert adapter is not None
-    assert isinstance(adapter, MagicMock)
+@pytest.mark.parametrize("specialist_name, adapter_cls", [
+    ("llm_specialist", GeminiAdapter),
+    ("hybrid_specialist", LocalInferenceAdapter),  # 'hybrid' specialists get adapters too
+    ("procedural_specialist", None),  # No adapter for 'procedural' specialists
+    ("unknown_provider_type_specialist", None),  # Provider 'type' not in the registry
+])
+def test_factory_create_adapter(adapter_factory, monkeypatch, specialist_name, adapter_cls):
+    """Tests which specialists get an adapter, and of which provider class."""
+    if adapter_cls is None:
+        assert adapter_factory.create_adapter(specialist_name, "system prompt") is None
+        return
+
+    mock_from_config = Mock(return_value=MagicMock(spec=adapter_cls))
+    monkeypatch.setattr(adapter_cls, "from_config", mock_from_config)
+    adapter = adapter_factory.create_adapter(specialist_name, "system prompt")
+
+    assert adapter is mock_from_config.return_value
     mock_from_config.assert_called_once()
 
-@patch('app.src.llm.local_inference_adapter.LocalInferenceAdapter.from_config')
-def test_factory_creates_adapter_for_hybrid_specialist(mock_from_config, adapter_factory):
-    """Tests that an adapter is correctly created for the new 'hybrid' specialist type."""
-    mock_from_config.return_value = MagicMock(spec=LocalInferenceAdapter)
-    adapter = adapter_factory.create_adapter("hybrid_specialist", "system prompt")
-    assert adapter is not None
-    assert isinstance(adapter, MagicMock)
-    mock_from_config.assert_called_once()
-
-def test_factory_returns_none_for_procedural_specialist(adapter_factory):
-    """Tests that no adapter is created for a 'procedural' specialist."""
-    adapter = adapter_factory.create_adapter("procedural_specialist", "system prompt")
-    assert adapter is None
-
-def test_factory_raises_error_for_missing_llm_config(adapter_factory):
-    """Tests that a ValueError is raised if 'llm_config' is missing for an LLM specialist."""
-    with pytest.raises(ValueError, match="is missing 'llm_config' key"):
-        adapter_factory.create_adapter("missing_binding_specialist", "system prompt")
-
-def test_factory_raises_error_for_unresolvable_provider(adapter_factory):
-    """Tests that a ValueError is raised if the provider key in 'llm_config' doesn't exist."""
-    with pytest.raises(ValueError, match="not found in 'llm_providers'"):
-        adapter_factory.create_adapter("unresolvable_binding_specialist", "system prompt")
-
-def test_factory_returns_none_for_unknown_provider_type(adapter_factory):
-    """Tests that the factory returns None if the provider 'type' is not in the registry."""
-    adapter = adapter_factory.create_adapter("unknown_provider_type_specialist", "system prompt")
-    assert adapter is None
+@pytest.mark.parametrize("specialist_name, error_match", [
+    ("missing_binding_specialist", "is missing 'llm_config' key"),
+    ("unresolvable_binding_specialist", "not found in 'llm_providers'"),
+])
+def test_factory_raises_error_for_bad_binding(adapter_factory, specialist_name, error_match):
+    """Tests that a ValueError is raised for a missing or unresolvable 'llm_config'."""
+    with pytest.raises(ValueError, match=error_match):
+        adapter_factory.create_adapter(specialist_name, "system prompt")
 
 # ==============================================================================
 # Provider Dependency Validation Tests
@@ -109,7 +99,13 @@ def config_with_gemini_webui():
         }
     }
 
-@patch('app.src.llm.factory._check_playwright_available')
+@pytest.fixture
+def mock_check(monkeypatch):
+    """Replaces the Playwright availability probe."""
+    fake = Mock()
+    monkeypatch.setattr("app.src.llm.factory._check_playwright_available", fake)
+    return fake
+
 def test_validate_dependencies_detects_missing_playwright(mock_check, config_with_gemini_webui):
     """Tests that validation detects missing Playwright for gemini_webui provider."""
     mock_check.return_value = False  # Playwright not available
@@ -124,7 +120,6 @@ def test_validate_dependencies_detects_missing_playwright(mock_check, config_wit
     assert "Playwright" in error_msg
     assert "pip install playwright" in error_msg
 
-@patch('app.src.llm.factory._check_playwright_available')
 def test_validate_dependencies_passes_when_playwright_available(mock_check, config_with_gemini_webui):
     """Tests that validation passes when Playwright is available."""
     mock_check.return_value = True  # Playwright available
@@ -178,10 +173,17 @@ def test_ping_provider_unknown_type():
     assert "Unknown provider type" in result["error"]
 
 
-@patch('app.src.llm.local_inference_adapter.LocalInferenceAdapter.from_config')
+@pytest.fixture
+def mock_from_config(monkeypatch):
+    """Replaces LocalInferenceAdapter.from_config so no real client is built."""
+    fake = Mock()
+    monkeypatch.setattr(LocalInferenceAdapter, "from_config", fake)
+    return fake
+
+
 def test_ping_provider_success(mock_from_config):
     """Tests successful ping returns correct result structure."""
-    mock_adapter = MagicMock()
+    mock_adapter = Mock()
     mock_adapter.invoke.return_value = {"text_response": "pong"}
     mock_from_config.return_value = mock_adapter
 
@@ -201,7 +203,6 @@ def test_ping_provider_success(mock_from_config):
     assert result["error"] is None
 
 
-@patch('app.src.llm.local_inference_adapter.LocalInferenceAdapter.from_config')
 def test_ping_provider_connection_error(mock_from_config):
     """Tests that ping_provider handles connection errors gracefully."""
     mock_from_config.side_effect = Exception("Connection refused")
@@ -220,10 +221,9 @@ def test_ping_provider_connection_error(mock_from_config):
     assert result["latency_ms"] is None
 
 
-@patch('app.src.llm.local_inference_adapter.LocalInferenceAdapter.from_config')
 def test_ping_provider_invoke_error(mock_from_config):
     """Tests that ping_provider handles invocation errors gracefully."""
-    mock_adapter = MagicMock()
+    mock_adapter = Mock()
     mock_adapter.invoke.side_effect = Exception("Model timeout")
     mock_from_config.return_value = mock_adapter
 
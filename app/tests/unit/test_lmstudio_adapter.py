@@ -1,19 +1,24 @@
 
 import json
+import time
 import pytest
 from unittest.mock import patch, MagicMock, call
 
-from app.src.llm.local_inference_adapter import LocalInferenceAdapter
+from app.src.llm.local_inference_adapter import LocalInferenceAdapter, strip_harmony_tokens
 from app.src.llm.adapter import StandardizedLLMRequest
 from app.src.utils.errors import LLMInvocationError, ProxyError
 from langchain_core.messages import HumanMessage
 import httpx
-from openai import APIConnectionError, PermissionDeniedError
-from pydantic import BaseModel
+from openai import APIConnectionError, InternalServerError, PermissionDeniedError
+from pydantic import BaseModel, Field
 
 MOCK_MODEL_NAME = "test-model/test-model-GGUF"
 MOCK_BASE_URL = "http://fake-lmstudio:1234/v1"
 
+# Shared by the error-path tests, which never look past the first message.
+# Adapters don't mutate the request, so one validated instance is enough.
+HELLO_REQUEST = StandardizedLLMRequest(messages=[HumanMessage(content="Hello")])
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Mocks environment variables for tests."""
@@ -90,11 +95,9 @@ def test_invoke_raises_llm_invocation_error(mock_openai_client, mock_model_confi
     mock_create = mock_openai_client.return_value.chat.completions.create
     mock_create.side_effect = Exception("API call failed")
 
-    request = StandardizedLLMRequest(messages=[HumanMessage(content="Hello")])
-
     # Act & Assert
     with pytest.raises(LLMInvocationError, match="API error: API call failed"):
-        adapter.invoke(request)
+        adapter.invoke(HELLO_REQUEST)
 
 @pytest.mark.parametrize("raised_exception", [
     APIConnectionError(request=MagicMock()),
@@ -112,14 +115,12 @@ def test_invoke_raises_proxy_error_on_connection_issues(mock_openai_client, mock
     mock_create = mock_openai_client.return_value.chat.completions.create
     mock_create.side_effect = raised_exception
 
-    request = StandardizedLLMRequest(messages=[HumanMessage(content="Hello")])
-
     expected_message = ("A network error occurred, which is often due to a proxy blocking the request. "
                         "Please check your proxy's 'squid.conf' to ensure the destination is whitelisted.")
 
     # Act & Assert
     with pytest.raises(ProxyError, match=expected_message):
-        adapter.invoke(request)
+        adapter.invoke(HELLO_REQUEST)
 
 
 # =============================================================================
@@ -397,7 +398,6 @@ class TestBuildToolCallSchemaRefFree:
         )
 
         # Create a tool schema with nested Pydantic model (generates $ref/$defs)
-        from pydantic import BaseModel, Field
 
         class InnerItem(BaseModel):
             name: str = Field(description="Item name")
@@ -429,7 +429,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class create_directory(BaseModel):
             path: str = Field(description="Directory path")
@@ -455,7 +454,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class create_directory(BaseModel):
             path: str = Field(description="Directory path")
@@ -483,7 +481,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -500,7 +497,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class Route(BaseModel):
             next_specialist: str = Field(description="Next specialist")
@@ -519,7 +515,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -543,7 +538,6 @@ class TestBuildToolCallSchemaOneOf:
             base_url=MOCK_BASE_URL,
             system_prompt="Test"
         )
-        from pydantic import Field
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -572,7 +566,6 @@ class TestParseCompletionActionsArray:
 
     def _make_request_and_kwargs(self, adapter, tool_classes):
         """Helper: build request + api_kwargs that trigger the JSON schema path."""
-        import time
         request = StandardizedLLMRequest(
             messages=[HumanMessage(content="test")],
             tools=tool_classes,
@@ -586,8 +579,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -615,8 +606,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -649,8 +638,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -678,8 +665,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -710,8 +695,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -738,8 +721,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -764,8 +745,6 @@ class TestParseCompletionActionsArray:
         adapter = LocalInferenceAdapter(
             model_config=mock_model_config, base_url=MOCK_BASE_URL, system_prompt=""
         )
-        from pydantic import Field
-        import time
 
         class read_file(BaseModel):
             path: str = Field(description="File path")
@@ -801,7 +780,6 @@ class TestParserParamFiltering:
 
     def test_get_known_params_for_tool_found(self):
         """Should return field names for matching tool."""
-        from pydantic import Field
 
         class create_directory(BaseModel):
             path: str = Field(description="Dir path")
@@ -816,7 +794,6 @@ class TestParserParamFiltering:
 
     def test_get_known_params_multi_field_tool(self):
         """Should return all field names for a multi-field tool."""
-        from pydantic import Field
 
         class move_file(BaseModel):
             source: str = Field(description="Source")
@@ -842,7 +819,6 @@ class TestHarmonyTokenStripping:
 
     def test_strip_harmony_tokens_from_structured_output(self):
         """Harmony-wrapped SystemPlan JSON should parse correctly after stripping."""
-        from app.src.llm.local_inference_adapter import strip_harmony_tokens
 
         # Simulate Harmony-wrapped response
         harmony_text = (
@@ -855,7 +831,6 @@ class TestHarmonyTokenStripping:
 
         # Should be parseable as JSON after stripping
         # (robust parser handles leftover channel labels like "final SystemPlan")
-        import json
         start = stripped.find('{')
         json_str = stripped[start:]
         parsed = json.loads(json_str)
@@ -864,7 +839,6 @@ class TestHarmonyTokenStripping:
 
     def test_strip_harmony_tokens_from_tool_response(self):
         """Harmony-wrapped tool call JSON should parse correctly after stripping."""
-        from app.src.llm.local_inference_adapter import strip_harmony_tokens
 
         harmony_text = (
             '<|start|>assistant<|channel|>final <|constrain|>json<|message|>'
@@ -872,14 +846,12 @@ class TestHarmonyTokenStripping:
         )
         stripped = strip_harmony_tokens(harmony_text)
 
-        import json
         start = stripped.find('{')
         parsed = json.loads(stripped[start:])
         assert parsed["actions"][0]["tool_name"] == "list_directory"
 
     def test_strip_preserves_clean_json(self):
         """When no Harmony tokens are present, content passes through unchanged."""
-        from app.src.llm.local_inference_adapter import strip_harmony_tokens
 
         clean_json = '{"plan_summary":"A plan.","execution_steps":["Step 1"]}'
         stripped = strip_harmony_tokens(clean_json)
@@ -1015,7 +987,6 @@ class TestGrammarParseRecovery:
 
     def _make_internal_server_error(self, json_content: str) -> "InternalServerError":
         """Build an InternalServerError matching llama-server's grammar parse failure format."""
-        from openai import InternalServerError
         error_body = {
             "error": {
                 "code": 500,
@@ -1047,7 +1018,6 @@ class TestGrammarParseRecovery:
             }),
         )
 
-        import time
         api_kwargs = adapter._build_request_kwargs(request)
         with pytest.raises(LLMInvocationError, match="API error"):
             adapter._call_with_error_handling(
@@ -1058,7 +1028,6 @@ class TestGrammarParseRecovery:
     @patch('app.src.llm.local_inference_adapter.OpenAI')
     def test_unwrapped_body_500_raises_llm_invocation_error(self, mock_openai, adapter):
         """InternalServerError with unwrapped body format → raises LLMInvocationError (#261)."""
-        from openai import InternalServerError
         error_body = {
             "code": 500,
             "message": 'Failed to parse input at pos 403: ```json\n{"reasoning": "Clear question", "actions": []}\n```',
@@ -1081,7 +1050,6 @@ class TestGrammarParseRecovery:
             }),
         )
 
-        import time
         api_kwargs = adapter._build_request_kwargs(request)
         with pytest.raises(LLMInvocationError, match="API error"):
             adapter._call_with_error_handling(
@@ -1092,7 +1060,6 @@ class TestGrammarParseRecovery:
     @patch('app.src.llm.local_inference_adapter.OpenAI')
     def test_non_parseable_500_still_raises(self, mock_openai, adapter):
         """InternalServerError with unparseable content → raises LLMInvocationError."""
-        from openai import InternalServerError
         error_body = {
             "error": {
                 "code": 500,
@@ -1112,7 +1079,6 @@ class TestGrammarParseRecovery:
 
         request = StandardizedLLMRequest(messages=[HumanMessage(content="hello")])
 
-        import time
         api_kwargs = adapter._build_request_kwargs(request)
         with pytest.raises(LLMInvocationError, match="API error"):
             adapter._call_with_error_handling(
@@ -1123,7 +1089,6 @@ class TestGrammarParseRecovery:
     @patch('app.src.llm.local_inference_adapter.OpenAI')
     def test_non_grammar_500_still_raises(self, mock_openai, adapter):
         """InternalServerError without 'Failed to parse input' → raises normally."""
-        from openai import InternalServerError
         error_body = {
             "error": {
                 "code": 500,
@@ -1143,7 +1108,6 @@ class TestGrammarParseRecovery:
 
         request = StandardizedLLMRequest(messages=[HumanMessage(content="hello")])
 
-        import time
         api_kwargs = adapter._build_request_kwargs(request)
         with pytest.raises(LLMInvocationError, match="API error"):
             adapter._call_with_error_handling(
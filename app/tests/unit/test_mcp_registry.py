@@ -314,33 +314,10 @@ class TestMcpRegistryTimeout:
 class TestMcpRegistryTracing:
     """Test suite for LangSmith tracing integration."""
 
-    def test_tracing_enabled_wraps_function(self):
-        """Test that tracing wraps function when enabled."""
-        config = {"mcp": {"tracing_enabled": True}}
-        registry = McpRegistry(config)
-
-        def test_function():
-            return "result"
-
-        registry.register_service("test_service", {"test": test_function})
-
-        request = McpRequest(
-            service_name="test_service",
-            function_name="test",
-            parameters={}
-        )
-
-        response = registry.dispatch(request)
-
-        # Function should execute successfully with or without LangSmith
-        assert response.status == "success"
-        assert response.data == "result"
-        # Note: Actual tracing behavior depends on LangSmith being installed
-        # This test verifies the registry doesn't break when tracing is enabled
-
-    def test_tracing_disabled_does_not_wrap(self):
-        """Test that tracing is skipped when disabled."""
-        config = {"mcp": {"tracing_enabled": False}}
+    @pytest.mark.parametrize("tracing_enabled", [True, False], ids=["tracing_on", "tracing_off"])
+    def test_tracing_flag_dispatches_normally(self, tracing_enabled):
+        """Test that dispatch succeeds, calling the function once, with tracing on or off."""
+        config = {"mcp": {"tracing_enabled": tracing_enabled}}
         registry = McpRegistry(config)
 
         call_count = 0
@@ -360,9 +337,12 @@ class TestMcpRegistryTracing:
 
         response = registry.dispatch(request)
 
+        # Function should execute successfully with or without LangSmith.
+        # Actual tracing behavior depends on LangSmith being installed; this
+        # verifies the registry doesn't break either way.
         assert response.status == "success"
         assert response.data == "result"
-        assert call_count == 1  # Function was called directly
+        assert call_count == 1
 
     def test_tracing_gracefully_handles_missing_langsmith(self):
         """Test that registry works when LangSmith is not installed."""
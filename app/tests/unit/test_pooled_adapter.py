@@ -2,7 +2,7 @@
 
 import asyncio
 import pytest
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import MagicMock, PropertyMock
 
 from app.src.llm.pooled_adapter import PooledLocalInferenceAdapter
 from app.src.llm.adapter import StandardizedLLMRequest
@@ -32,6 +32,22 @@ def _make_pool_and_dispatcher(server_url=MOCK_SERVER_URL, api_key=None):
     return pool, dispatcher, loop
 
 
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Replaces the OpenAI client class the adapter builds per request."""
+    fake = MagicMock()
+    monkeypatch.setattr("app.src.llm.pooled_adapter.OpenAI", fake)
+    return fake
+
+
+@pytest.fixture
+def mock_run_coro(monkeypatch):
+    """Replaces asyncio.run_coroutine_threadsafe (the pool slot acquisition hop)."""
+    fake = MagicMock()
+    monkeypatch.setattr("app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe", fake)
+    return fake
+
+
 def _make_adapter(pool, dispatcher, loop, model_name=MOCK_MODEL_NAME):
     """Create a PooledLocalInferenceAdapter with mocked pool infrastructure."""
     model_config = {
@@ -87,8 +103,6 @@ class TestConstruction:
 
 
 class TestInvoke:
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_acquires_and_releases_server(self, mock_run_coro, mock_openai):
         """invoke() acquires a server slot and releases it in finally."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -113,8 +127,6 @@ class TestInvoke:
         assert result.get("text_response") == "test response"
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_releases_server_on_error(self, mock_run_coro, mock_openai):
         """Server slot is released even when the HTTP call fails."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -136,8 +148,6 @@ class TestInvoke:
         pool.release_server.assert_called_once_with(MOCK_SERVER_URL)
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_creates_client_with_acquired_url(self, mock_run_coro, mock_openai):
         """OpenAI client is created with the URL returned by the pool."""
         acquired_url = "http://gpu1:5678"
@@ -162,7 +172,6 @@ class TestInvoke:
         pool.release_server.assert_called_once_with(acquired_url)
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_timeout_waiting_for_slot(self, mock_run_coro):
         """LLMInvocationError raised when pool can't provide a slot in time."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -187,8 +196,6 @@ class TestInvoke:
 
 
 class TestModelIdOverride:
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_uses_request_model_id_when_provided(self, mock_run_coro, mock_openai):
         """model_id from request is passed to dispatcher.submit()."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -215,8 +222,6 @@ class TestModelIdOverride:
         # Since we mock run_coroutine_threadsafe, check the args
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_falls_back_to_model_name_when_no_model_id(self, mock_run_coro, mock_openai):
         """Falls back to adapter's model_name when request.model_id is None."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -318,8 +323,6 @@ class TestAdapterFactoryPool:
 
 
 class TestHealthFeedback:
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_connection_error_reports_server_dead(self, mock_run_coro, mock_openai):
         """APIConnectionError triggers report_server_error to mark server dead."""
         from openai import APIConnectionError
@@ -347,8 +350,6 @@ class TestHealthFeedback:
         pool.release_server.assert_called_once_with(MOCK_SERVER_URL)
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_generic_error_does_not_report_server_dead(self, mock_run_coro, mock_openai):
         """Non-transport errors (e.g. BadRequestError) do NOT mark server dead."""
         pool, dispatcher, loop = _make_pool_and_dispatcher()
@@ -386,8 +387,6 @@ class TestApiKey:
         assert adapter.api_key == "pool-server-token"
         loop.close()
 
-    @patch('app.src.llm.pooled_adapter.OpenAI')
-    @patch('app.src.llm.pooled_adapter.asyncio.run_coroutine_threadsafe')
     def test_api_key_used_in_per_request_client(self, mock_run_coro, mock_openai):
         """Per-request OpenAI client uses per-server api_key from pool."""
         pool, dispatcher, loop = _make_pool_and_dispatcher(api_key="server-token")
@@ -0,0 +1,58 @@
+# app/tests/unit/test_process_stats.py
+import json
+import os
+import time
+
+import psutil
+
+from app.src.observability.process_stats import (
+    STATS_FILE_ENV,
+    ProcessStatsPublisher,
+    start_process_stats_publisher,
+)
+
+
+def _wait_for_file(path, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        assert time.monotonic() < deadline, f"{path} was never written"
+        time.sleep(0.01)
+
+
+def test_publisher_writes_and_removes_stats_file(tmp_path):
+    """Tests that the publisher writes this process's stats and cleans up on stop."""
+    stats_file = tmp_path / "server_stats.json"
+    publisher = ProcessStatsPublisher(str(stats_file), interval=0.05)
+
+    publisher.start()
+    try:
+        _wait_for_file(stats_file)
+        stats = json.loads(stats_file.read_text())
+    finally:
+        publisher.stop()
+
+    assert stats["pid"] == os.getpid()
+    assert stats["create_time"] == psutil.Process().create_time()
+    assert stats["rss"] > 0
+    assert stats["cpu_percent"] >= 0
+    assert stats["interval"] == 0.05
+    assert not stats_file.exists()
+
+
+def test_start_publisher_is_noop_without_env(monkeypatch):
+    """Tests that servers not launched by the control script publish nothing."""
+    monkeypatch.delenv(STATS_FILE_ENV, raising=False)
+    assert start_process_stats_publisher() is None
+
+
+def test_start_publisher_uses_env_path(tmp_path, monkeypatch):
+    """Tests that the publisher writes to the path the control script passed in."""
+    stats_file = tmp_path / "server_stats.json"
+    monkeypatch.setenv(STATS_FILE_ENV, str(stats_file))
+
+    publisher = start_process_stats_publisher()
+    try:
+        assert publisher is not None
+        assert publisher.path == str(stats_file)
+    finally:
+        publisher.stop()
@@ -21,14 +21,14 @@ def test_progenitor_alpha_initialization(progenitor_alpha):
     assert progenitor_alpha.llm_adapter is not None
 
 
-def test_progenitor_alpha_generates_analytical_response(progenitor_alpha):
+def test_progenitor_alpha_generates_analytical_response(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha generates an analytical perspective response."""
     # Arrange
     mock_response = "**Analytical Definition**: Python is a high-level, interpreted programming language..."
     progenitor_alpha.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     # Act
@@ -48,14 +48,14 @@ def test_progenitor_alpha_generates_analytical_response(progenitor_alpha):
     assert result_state["artifacts"]["alpha_response.md"] == mock_response
 
 
-def test_progenitor_alpha_stores_response_in_artifacts(progenitor_alpha):
+def test_progenitor_alpha_stores_response_in_artifacts(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha stores response in artifacts.alpha_response.md."""
     # Arrange
     mock_response = "Structured analytical response about Python."
     progenitor_alpha.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     # Act
@@ -68,14 +68,14 @@ def test_progenitor_alpha_stores_response_in_artifacts(progenitor_alpha):
     assert result_state["artifacts"]["alpha_response.md"] == mock_response
 
 
-def test_progenitor_alpha_does_not_set_task_complete(progenitor_alpha):
+def test_progenitor_alpha_does_not_set_task_complete(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha does NOT set task_is_complete (TieredSynthesizer does)."""
     # Arrange
     mock_response = "Analytical response."
     progenitor_alpha.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="Test")]
+        "messages": [msg_factory(HumanMessage, "Test")]
     }
 
     # Act
@@ -88,7 +88,7 @@ def test_progenitor_alpha_does_not_set_task_complete(progenitor_alpha):
     assert result_state.get("task_is_complete") in [None, False]
 
 
-def test_progenitor_alpha_maintains_conversation_context(progenitor_alpha):
+def test_progenitor_alpha_maintains_conversation_context(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha sends full conversation history to LLM."""
     # Arrange
     mock_response = "Analytical follow-up response."
@@ -97,9 +97,9 @@ def test_progenitor_alpha_maintains_conversation_context(progenitor_alpha):
     # Simulate multi-turn conversation
     initial_state = {
         "messages": [
-            HumanMessage(content="What is Python?"),
+            msg_factory(HumanMessage, "What is Python?"),
             AIMessage(content="Python is a programming language.", name="progenitor_alpha_specialist"),
-            HumanMessage(content="Who created it?")
+            msg_factory(HumanMessage, "Who created it?")
         ]
     }
 
@@ -113,14 +113,14 @@ def test_progenitor_alpha_maintains_conversation_context(progenitor_alpha):
     assert len(request.messages) == 3  # All three messages should be passed
 
 
-def test_progenitor_alpha_handles_llm_failure_gracefully(progenitor_alpha):
+def test_progenitor_alpha_handles_llm_failure_gracefully(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha provides fallback message when LLM fails."""
     # Arrange
     # Simulate LLM returning no text_response
     progenitor_alpha.llm_adapter.invoke.return_value = {"text_response": None}
 
     initial_state = {
-        "messages": [HumanMessage(content="Hello")]
+        "messages": [msg_factory(HumanMessage, "Hello")]
     }
 
     # Act
@@ -136,7 +136,7 @@ def test_progenitor_alpha_handles_llm_failure_gracefully(progenitor_alpha):
     assert "unable to provide a response" in result_state["artifacts"]["alpha_response.md"].lower()
 
 
-def test_progenitor_alpha_stores_content_in_artifacts(progenitor_alpha):
+def test_progenitor_alpha_stores_content_in_artifacts(progenitor_alpha, msg_factory):
     """Tests that ProgenitorAlpha stores response content in artifacts (state management)."""
     # Arrange
     mock_response = "Analytical test response."
@@ -144,7 +144,7 @@ def test_progenitor_alpha_stores_content_in_artifacts(progenitor_alpha):
     progenitor_alpha.llm_adapter.model_name = "test-analytical-model"
 
     initial_state = {
-        "messages": [HumanMessage(content="Test question")]
+        "messages": [msg_factory(HumanMessage, "Test question")]
     }
 
     # Act
@@ -183,7 +183,7 @@ def test_progenitor_alpha_handles_empty_message_history(progenitor_alpha):
     assert result_state["artifacts"]["alpha_response.md"] == mock_response
 
 
-def test_progenitor_alpha_artifact_key_has_md_extension(progenitor_alpha):
+def test_progenitor_alpha_artifact_key_has_md_extension(progenitor_alpha, msg_factory):
     """
     Verifies that ProgenitorAlpha saves with .md extension for proper archival.
 
@@ -195,7 +195,7 @@ def test_progenitor_alpha_artifact_key_has_md_extension(progenitor_alpha):
     progenitor_alpha.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     result_state = progenitor_alpha._execute_logic(initial_state)
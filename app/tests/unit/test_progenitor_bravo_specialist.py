@@ -21,14 +21,14 @@ def test_progenitor_bravo_initialization(progenitor_bravo):
     assert progenitor_bravo.llm_adapter is not None
 
 
-def test_progenitor_bravo_generates_contextual_response(progenitor_bravo):
+def test_progenitor_bravo_generates_contextual_response(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo generates a contextual perspective response."""
     # Arrange
     mock_response = "Python is like a Swiss Army knife for programmers - versatile and accessible..."
     progenitor_bravo.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     # Act
@@ -48,14 +48,14 @@ def test_progenitor_bravo_generates_contextual_response(progenitor_bravo):
     assert result_state["artifacts"]["bravo_response.md"] == mock_response
 
 
-def test_progenitor_bravo_stores_response_in_artifacts(progenitor_bravo):
+def test_progenitor_bravo_stores_response_in_artifacts(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo stores response in artifacts.bravo_response.md."""
     # Arrange
     mock_response = "Contextual, intuitive response about Python."
     progenitor_bravo.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     # Act
@@ -68,14 +68,14 @@ def test_progenitor_bravo_stores_response_in_artifacts(progenitor_bravo):
     assert result_state["artifacts"]["bravo_response.md"] == mock_response
 
 
-def test_progenitor_bravo_does_not_set_task_complete(progenitor_bravo):
+def test_progenitor_bravo_does_not_set_task_complete(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo does NOT set task_is_complete (TieredSynthesizer does)."""
     # Arrange
     mock_response = "Contextual response."
     progenitor_bravo.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="Test")]
+        "messages": [msg_factory(HumanMessage, "Test")]
     }
 
     # Act
@@ -88,7 +88,7 @@ def test_progenitor_bravo_does_not_set_task_complete(progenitor_bravo):
     assert result_state.get("task_is_complete") in [None, False]
 
 
-def test_progenitor_bravo_maintains_conversation_context(progenitor_bravo):
+def test_progenitor_bravo_maintains_conversation_context(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo sends full conversation history to LLM."""
     # Arrange
     mock_response = "Contextual follow-up response."
@@ -97,9 +97,9 @@ def test_progenitor_bravo_maintains_conversation_context(progenitor_bravo):
     # Simulate multi-turn conversation
     initial_state = {
         "messages": [
-            HumanMessage(content="What is Python?"),
+            msg_factory(HumanMessage, "What is Python?"),
             AIMessage(content="Python is like a Swiss Army knife...", name="progenitor_bravo_specialist"),
-            HumanMessage(content="Who created it?")
+            msg_factory(HumanMessage, "Who created it?")
         ]
     }
 
@@ -113,14 +113,14 @@ def test_progenitor_bravo_maintains_conversation_context(progenitor_bravo):
     assert len(request.messages) == 3  # All three messages should be passed
 
 
-def test_progenitor_bravo_handles_llm_failure_gracefully(progenitor_bravo):
+def test_progenitor_bravo_handles_llm_failure_gracefully(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo provides fallback message when LLM fails."""
     # Arrange
     # Simulate LLM returning no text_response
     progenitor_bravo.llm_adapter.invoke.return_value = {"text_response": None}
 
     initial_state = {
-        "messages": [HumanMessage(content="Hello")]
+        "messages": [msg_factory(HumanMessage, "Hello")]
     }
 
     # Act
@@ -136,7 +136,7 @@ def test_progenitor_bravo_handles_llm_failure_gracefully(progenitor_bravo):
     assert "unable to provide a response" in result_state["artifacts"]["bravo_response.md"].lower()
 
 
-def test_progenitor_bravo_stores_content_in_artifacts(progenitor_bravo):
+def test_progenitor_bravo_stores_content_in_artifacts(progenitor_bravo, msg_factory):
     """Tests that ProgenitorBravo stores response content in artifacts (state management)."""
     # Arrange
     mock_response = "Contextual test response."
@@ -144,7 +144,7 @@ def test_progenitor_bravo_stores_content_in_artifacts(progenitor_bravo):
     progenitor_bravo.llm_adapter.model_name = "test-contextual-model"
 
     initial_state = {
-        "messages": [HumanMessage(content="Test question")]
+        "messages": [msg_factory(HumanMessage, "Test question")]
     }
 
     # Act
@@ -183,7 +183,7 @@ def test_progenitor_bravo_handles_empty_message_history(progenitor_bravo):
     assert result_state["artifacts"]["bravo_response.md"] == mock_response
 
 
-def test_progenitor_bravo_artifact_key_has_md_extension(progenitor_bravo):
+def test_progenitor_bravo_artifact_key_has_md_extension(progenitor_bravo, msg_factory):
     """
     Verifies that ProgenitorBravo saves with .md extension for proper archival.
 
@@ -195,7 +195,7 @@ def test_progenitor_bravo_artifact_key_has_md_extension(progenitor_bravo):
     progenitor_bravo.llm_adapter.invoke.return_value = {"text_response": mock_response}
 
     initial_state = {
-        "messages": [HumanMessage(content="What is Python?")]
+        "messages": [msg_factory(HumanMessage, "What is Python?")]
     }
 
     result_state = progenitor_bravo._execute_logic(initial_state)
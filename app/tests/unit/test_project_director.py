@@ -24,13 +24,6 @@ def mock_specialist_config():
     }
 
 
-@pytest.fixture
-def mock_llm_adapter():
-    """Mock LLM adapter that simulates search-then-synthesize behavior."""
-    adapter = MagicMock()
-    return adapter
-
-
 @pytest.fixture
 def mock_mcp_client():
     """Mock MCP client."""
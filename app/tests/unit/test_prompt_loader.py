@@ -0,0 +1,42 @@
+# app/tests/unit/test_prompt_loader.py
+import pytest
+from app.src.utils import prompt_loader
+from app.src.utils.prompt_loader import load_prompt
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    """Points the loader at a temp app root with an empty prompts/ dir."""
+    (tmp_path / "prompts").mkdir()
+    monkeypatch.setattr(prompt_loader, "APP_ROOT", tmp_path)
+    load_prompt.cache_clear()
+    yield tmp_path / "prompts"
+    load_prompt.cache_clear()
+
+
+def test_load_prompt_strips_content(prompts_dir):
+    """Tests that the prompt text is returned without surrounding whitespace."""
+    (prompts_dir / "greeting.md").write_text("\n  Hello there.  \n")
+    assert load_prompt("greeting.md") == "Hello there."
+
+
+def test_load_prompt_is_memoized(prompts_dir):
+    """Tests that repeat loads are served from cache until cache_clear()."""
+    prompt_file = prompts_dir / "cached.md"
+    prompt_file.write_text("v1")
+    assert load_prompt("cached.md") == "v1"
+
+    prompt_file.write_text("v2")
+    assert load_prompt("cached.md") == "v1"
+
+    load_prompt.cache_clear()
+    assert load_prompt("cached.md") == "v2"
+
+
+def test_load_prompt_missing_file_is_not_cached(prompts_dir):
+    """Tests that a missing prompt raises, and a later-created file is picked up."""
+    with pytest.raises(FileNotFoundError, match="Prompt file not found"):
+        load_prompt("late.md")
+
+    (prompts_dir / "late.md").write_text("now here")
+    assert load_prompt("late.md") == "now here"
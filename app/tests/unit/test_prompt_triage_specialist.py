@@ -1,10 +1,10 @@
 import pytest
 from unittest.mock import MagicMock, ANY
 from langchain_core.messages import HumanMessage
-from app.src.specialists.prompt_triage_specialist import PromptTriageSpecialist
 from app.src.specialists.schemas import TriageRecommendations
 from app.src.enums import CoreSpecialist
 from app.src.llm.adapter import StandardizedLLMRequest
+from app.tests.helpers import FakeAdapter
 
 @pytest.fixture
 def prompt_triage_specialist(initialized_specialist_factory):
@@ -47,7 +47,7 @@ def test_prompt_triage_recommends_specialists_from_llm(prompt_triage_specialist)
 def test_prompt_triage_falls_back_to_default_responder_on_no_tool_call(prompt_triage_specialist):
     """Tests fallback to default_responder when LLM provides no valid tool call."""
     # Arrange
-    prompt_triage_specialist.llm_adapter.invoke.return_value = {"tool_calls": []}
+    prompt_triage_specialist.llm_adapter = FakeAdapter({"tool_calls": []})
 
     initial_state = {"messages": [HumanMessage(content="Just chat with me.")]}
 
@@ -55,7 +55,7 @@ def test_prompt_triage_falls_back_to_default_responder_on_no_tool_call(prompt_tr
     result_state = prompt_triage_specialist._execute_logic(initial_state)
 
     # Assert
-    prompt_triage_specialist.llm_adapter.invoke.assert_called_once()
+    assert prompt_triage_specialist.llm_adapter.call_count == 1
     # Task 2.7: fields moved to scratchpad
     assert result_state["scratchpad"]["recommended_specialists"] == [CoreSpecialist.DEFAULT_RESPONDER.value]
     assert result_state["scratchpad"]["triage_recommendations"] == [CoreSpecialist.DEFAULT_RESPONDER.value]
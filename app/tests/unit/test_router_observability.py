@@ -9,7 +9,6 @@ import pytest
 from unittest.mock import MagicMock, patch
 from langgraph.graph import END
 from langchain_core.messages import HumanMessage
-from app.src.specialists.router_specialist import RouterSpecialist
 from app.src.graph.state_factory import create_test_state
 
 
@@ -4,37 +4,33 @@ import logging
 from unittest.mock import MagicMock, patch, ANY, call
 from langgraph.graph import END
 from langchain_core.messages import AIMessage, HumanMessage
-from app.src.specialists.router_specialist import (
-    RouterSpecialist,
-    _build_route_response_model,
-)
+from app.src.specialists.router_specialist import _build_route_response_model
 from app.src.utils.errors import LLMInvocationError
 from app.src.enums import CoreSpecialist
 from app.src.graph.state_factory import create_test_state
+from app.tests.helpers import FakeAdapter, FailingAdapter
 
 @pytest.fixture
 def router_specialist(initialized_specialist_factory):
     """Fixture for an initialized RouterSpecialist."""
     return initialized_specialist_factory("RouterSpecialist")
 
-# --- Fine-Grained Unit Tests for Helper Methods ---
+@pytest.fixture
+def validating_router(specialist_registry):
+    """
+    The session's shared RouterSpecialist, for the _validate_llm_choice tests.
+    That method reads no instance state, so these tests skip the per-test
+    mocked setup.
+    """
+    return specialist_registry("RouterSpecialist")
 
-def test_get_available_specialists_no_recommendations(router_specialist):
-    """Tests that all specialists are returned when no recommendations are present."""
-    # Arrange
-    router_specialist.set_specialist_map({
-        "spec1": {"desc": "d1"},
-        "spec2": {"desc": "d2"}
-    })
-    state = {"messages": []} # No recommended_specialists
-    # Act
-    available = router_specialist._get_available_specialists(state)
-    # Assert
-    assert "spec1" in available
-    assert "spec2" in available
-    assert len(available) == 2
+# --- Fine-Grained Unit Tests for Helper Methods ---
 
-def test_get_available_specialists_with_recommendations(router_specialist):
+@pytest.mark.parametrize("state", [
+    {"messages": []},  # No recommended_specialists
+    {"recommended_specialists": ["spec1", "spec3"]},
+], ids=["no_recommendations", "with_recommendations"])
+def test_get_available_specialists_ignores_recommendations(router_specialist, state):
     """Tests that the specialist list is NOT filtered by recommendations (advisory mode).
 
     As of ADR-CORE-011, triage recommendations are advisory, not restrictive.
@@ -47,7 +43,6 @@ def test_get_available_specialists_with_recommendations(router_specialist):
         "spec2": {"desc": "d2"},
         "spec3": {"desc": "d3"}
     })
-    state = {"recommended_specialists": ["spec1", "spec3"]}
     # Act
     available = router_specialist._get_available_specialists(state)
     # Assert: ALL specialists are available, regardless of recommendations
@@ -73,75 +68,75 @@ def test_handle_llm_failure_fallback_priority(router_specialist):
     result = router_specialist._handle_llm_failure()
     assert result["next_specialist"] == END
 
-def test_validate_llm_choice_accept(router_specialist):
+def test_validate_llm_choice_accept(validating_router):
     """Valid string choice returns (choice, True)."""
     valid_options = ["spec1", "spec2"]
-    choice, is_valid = router_specialist._validate_llm_choice("spec1", valid_options)
+    choice, is_valid = validating_router._validate_llm_choice("spec1", valid_options)
     assert choice == "spec1"
     assert is_valid is True
 
-def test_validate_llm_choice_reject_string(router_specialist):
+def test_validate_llm_choice_reject_string(validating_router):
     """Invalid string choice returns (None, False) — no silent fallback."""
     valid_options = ["spec1", "spec2"]
-    choice, is_valid = router_specialist._validate_llm_choice("invalid_spec", valid_options)
+    choice, is_valid = validating_router._validate_llm_choice("invalid_spec", valid_options)
     assert choice is None
     assert is_valid is False
 
-def test_validate_llm_choice_list_all_valid(router_specialist):
+def test_validate_llm_choice_list_all_valid(validating_router):
     """All-valid list passes through unchanged (no unwrapping)."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(["spec1", "spec2"], valid_options)
+    choice, is_valid = validating_router._validate_llm_choice(["spec1", "spec2"], valid_options)
     assert choice == ["spec1", "spec2"]
     assert is_valid is True
 
-def test_validate_llm_choice_list_preserves_single_item(router_specialist):
+def test_validate_llm_choice_list_preserves_single_item(validating_router):
     """Single-item list is preserved as a list — no unwrapping to string."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(["spec1"], valid_options)
+    choice, is_valid = validating_router._validate_llm_choice(["spec1"], valid_options)
     assert choice == ["spec1"]
     assert is_valid is True
     assert isinstance(choice, list)
 
-def test_validate_llm_choice_list_rejects_entirely_on_any_invalid(router_specialist):
+def test_validate_llm_choice_list_rejects_entirely_on_any_invalid(validating_router):
     """Mixed valid/invalid list is rejected entirely — no partial filtering."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(
+    choice, is_valid = validating_router._validate_llm_choice(
         ["spec1", "invalid_spec"], valid_options
     )
     assert choice is None
     assert is_valid is False
 
-def test_validate_llm_choice_list_all_invalid(router_specialist):
+def test_validate_llm_choice_list_all_invalid(validating_router):
     """All-invalid list returns (None, False)."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(
+    choice, is_valid = validating_router._validate_llm_choice(
         ["invalid1", "invalid2"], valid_options
     )
     assert choice is None
     assert is_valid is False
 
 
-def test_validate_deduplicates_list(router_specialist):
+def test_validate_deduplicates_list(validating_router):
     """Duplicate specialist names are removed, preserving first-occurrence order (#219)."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(
+    choice, is_valid = validating_router._validate_llm_choice(
         ["spec1", "spec2", "spec1", "spec2", "spec3"], valid_options
     )
     assert is_valid is True
     assert choice == ["spec1", "spec2", "spec3"]
 
 
-def test_validate_all_available_selected_not_truncated(router_specialist):
+def test_validate_all_available_selected_not_truncated(validating_router):
     """Selecting all available specialists is valid — cap only fires above count (#219)."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(
+    choice, is_valid = validating_router._validate_llm_choice(
         ["spec1", "spec2", "spec3"], valid_options
     )
     assert is_valid is True
     assert choice == ["spec1", "spec2", "spec3"]
 
 
-def test_validate_dedup_and_cap_combined(router_specialist):
+def test_validate_dedup_and_cap_combined(validating_router):
     """Duplicates removed first, then length capped (#219).
 
     Simulates the LFM2 failure: 12 entries from 8 available, with duplicates.
@@ -160,7 +155,7 @@ def test_validate_dedup_and_cap_combined(router_specialist):
         "default_responder_specialist", "text_analysis_specialist",
         "web_builder", "image_specialist",
     ]
-    choice, is_valid = router_specialist._validate_llm_choice(llm_choice, valid_options)
+    choice, is_valid = validating_router._validate_llm_choice(llm_choice, valid_options)
     assert is_valid is True
     # 6 unique entries from the 12, in first-occurrence order
     assert choice == [
@@ -171,10 +166,10 @@ def test_validate_dedup_and_cap_combined(router_specialist):
     assert len(choice) == 6  # deduped from 12
 
 
-def test_validate_preserves_valid_list(router_specialist):
+def test_validate_preserves_valid_list(validating_router):
     """Clean list without duplicates passes through unchanged (#219)."""
     valid_options = ["spec1", "spec2", "spec3"]
-    choice, is_valid = router_specialist._validate_llm_choice(
+    choice, is_valid = validating_router._validate_llm_choice(
         ["spec1", "spec3"], valid_options
     )
     assert is_valid is True
@@ -210,18 +205,33 @@ def test_router_stage_3_termination_logic(router_specialist):
     assert result["next_specialist"] == END
 
 
-def test_router_normal_llm_routing(router_specialist):
+@pytest.mark.parametrize("llm_response, expected_specialist, expected_calls, expected_message", [
+    # Valid choice: routed on the first call.
+    ({"json_response": {"next_specialist": ["file_specialist"]}}, "file_specialist", 1,
+     "Routing to specialist: file_specialist"),
+    # Invalid choice: with max_routing_retries=1 (default) the router retries
+    # once (the fake returns the same answer), then falls back.
+    ({"json_response": {"next_specialist": ["non_existent_specialist"]}},
+     CoreSpecialist.DEFAULT_RESPONDER.value, 2,
+     "Routing to specialist: default_responder_specialist"),
+    # No structured output at all: no retry, straight to the fallback handler.
+    ({"text_response": "I am not sure what to do."}, CoreSpecialist.DEFAULT_RESPONDER.value, 1,
+     "Router failed to select a valid next specialist"),
+], ids=["valid_choice", "invalid_choice_retry", "malformed_response"])
+def test_router_llm_routing(
+    router_specialist, llm_response, expected_specialist, expected_calls, expected_message
+):
     """
-    Tests the primary path where the router uses the LLM to decide the next specialist.
+    Tests the path where the router uses the LLM to decide the next specialist,
+    including retry and fallback when the LLM's answer is unusable.
     """
     # Arrange
-    router_specialist.set_specialist_map({"file_specialist": {"description": "File ops"}})
-
-    mock_adapter = router_specialist.llm_adapter
+    router_specialist.set_specialist_map({
+        "file_specialist": {"description": "File ops"},
+        CoreSpecialist.DEFAULT_RESPONDER.value: {"description": "Fallback"},
+    })
     # Router now uses output_model_class (json_response) instead of tool_calls
-    mock_adapter.invoke.return_value = {
-        "json_response": {"next_specialist": ["file_specialist"]}
-    }
+    router_specialist.llm_adapter = FakeAdapter(llm_response)
 
     initial_state = create_test_state(
         messages=[HumanMessage(content="Please read my_file.txt")],
@@ -233,13 +243,13 @@ def test_router_normal_llm_routing(router_specialist):
     result = router_specialist._execute_logic(initial_state)
 
     # Assert
-    mock_adapter.invoke.assert_called_once()
-    assert result["next_specialist"] == "file_specialist"
+    assert router_specialist.llm_adapter.call_count == expected_calls
+    assert result["next_specialist"] == expected_specialist
     assert result.get("turn_count", 0) == 2
     ai_message = result["messages"][0]
     assert isinstance(ai_message, AIMessage)
     assert ai_message.additional_kwargs["routing_type"] == "llm_decision"
-    assert "Routing to specialist: file_specialist" in ai_message.content
+    assert expected_message in ai_message.content
 
 def test_router_handles_llm_invocation_error(router_specialist):
     """
@@ -248,8 +258,7 @@ def test_router_handles_llm_invocation_error(router_specialist):
     # Arrange
     router_specialist.set_specialist_map({"file_specialist": {"description": "File ops"}})
 
-    mock_adapter = router_specialist.llm_adapter
-    mock_adapter.invoke.side_effect = LLMInvocationError("API is down")
+    router_specialist.llm_adapter = FailingAdapter(LLMInvocationError("API is down"))
 
     initial_state = {"messages": [HumanMessage(content="Read a file")]}
 
@@ -257,33 +266,6 @@ def test_router_handles_llm_invocation_error(router_specialist):
     with pytest.raises(LLMInvocationError, match="API is down"):
         router_specialist._execute_logic(initial_state)
 
-def test_router_handles_invalid_llm_response_with_retry(router_specialist):
-    """Router retries once on invalid choice, then falls back to default_responder.
-
-    With max_routing_retries=1 (default), the adapter is called twice:
-    once for the initial invalid response, once for the retry (also invalid
-    here because the mock always returns the same thing).
-    """
-    # Arrange
-    router_specialist.set_specialist_map({"file_specialist": {"description": "File ops"}})
-
-    mock_adapter = router_specialist.llm_adapter
-    mock_adapter.invoke.return_value = {
-        "json_response": {"next_specialist": ["non_existent_specialist"]}
-    }
-
-    initial_state = {"messages": [HumanMessage(content="Do something weird")]}
-
-    # Act
-    result = router_specialist._execute_logic(initial_state)
-
-    # Assert: 2 calls (initial + 1 retry)
-    assert mock_adapter.invoke.call_count == 2
-    assert result["next_specialist"] == CoreSpecialist.DEFAULT_RESPONDER.value
-    ai_message = result["messages"][0]
-    assert "Routing to specialist: default_responder_specialist" in ai_message.content
-    assert ai_message.additional_kwargs["routing_type"] == "llm_decision"
-
 def test_get_available_specialists_context_aware_filtering_with_tags(router_specialist):
     """Tests that context_engineering specialists are filtered out after context gathering.
 
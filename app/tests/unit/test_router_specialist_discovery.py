@@ -7,7 +7,6 @@ This is critical for ADR-001 (ChatSpecialist) and future specialist additions.
 """
 import pytest
 from unittest.mock import MagicMock
-from app.src.specialists.router_specialist import RouterSpecialist
 
 
 def test_router_discovers_specialists_from_config(initialized_specialist_factory):
@@ -12,6 +12,7 @@ from app.src.specialists.helpers import (
     create_error_message,
     create_decline_response,
 )
+from app.tests.helpers import make_mock_adapter
 
 
 class TestCreateDeclineResponse:
@@ -91,9 +92,7 @@ class TestCreateLlmMessage:
 
     def test_llm_message_with_adapter(self):
         """Test message creation with adapter."""
-        from unittest.mock import MagicMock
-
-        mock_adapter = MagicMock()
+        mock_adapter = make_mock_adapter()
         mock_adapter.model_name = "test-model-v1"
 
         result = create_llm_message(
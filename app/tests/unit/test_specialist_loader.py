@@ -1,19 +1,27 @@
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from app.src.specialists import get_specialist_class
-
-def test_get_specialist_class_success():
+from app.src.specialists.prompt_specialist import PromptSpecialist
+from app.src.specialists.router_specialist import RouterSpecialist
+from app.src.specialists.text_analysis_specialist import TextAnalysisSpecialist
+from app.src.specialists.web_builder import WebBuilder
+
+@pytest.mark.parametrize("specialist_name, expected_class", [
+    ("router_specialist", RouterSpecialist),
+    ("prompt_specialist", PromptSpecialist),
+    ("text_analysis_specialist", TextAnalysisSpecialist),
+    ("web_builder", WebBuilder),  # Name without the '_specialist' suffix
+])
+def test_get_specialist_class_success(specialist_name, expected_class):
     """
     Tests that the loader can successfully import and return a class
     when the module and class exist.
     """
-    # We test with a real, existing specialist
-    from app.src.specialists.router_specialist import RouterSpecialist
-    
-    loaded_class = get_specialist_class("router_specialist", config={})
-    assert loaded_class == RouterSpecialist
+    loaded_class = get_specialist_class(specialist_name, config={})
+    assert loaded_class is expected_class
 
 @patch('importlib.import_module')
 def test_get_specialist_class_import_error(mock_import_module):
@@ -36,11 +44,8 @@ def test_get_specialist_class_attribute_error(mock_import_module):
     but the corresponding specialist class (e.g., MySpecialist) is not in it.
     """
     specialist_name = "my_specialist"
-    mock_module = MagicMock()
-    # Configure the mock module to not have the expected class attribute
-    del mock_module.MySpecialist
-
-    mock_import_module.return_value = mock_module
+    # An empty stand-in module: it has no MySpecialist attribute
+    mock_import_module.return_value = SimpleNamespace()
 
     with pytest.raises(ImportError, match="Could not find specialist class 'MySpecialist'"):
         get_specialist_class(specialist_name, config={})
@@ -3,10 +3,10 @@ import pytest
 from unittest.mock import MagicMock, ANY
 from pydantic import BaseModel, Field
 
-from app.src.specialists.structured_data_extractor import StructuredDataExtractor
 from langchain_core.messages import HumanMessage, AIMessage
 from app.src.utils.errors import LLMInvocationError
 from app.src.specialists.helpers import create_llm_message
+from app.tests.helpers import FakeAdapter
 
 # Define a simple Pydantic schema for testing purposes
 class MockUserInfo(BaseModel):
@@ -80,7 +80,7 @@ def test_structured_data_extractor_llm_fails_to_extract(structured_data_extracto
     """Tests the fallback mechanism when the LLM fails to return a tool call."""
     # Arrange
     # Simulate the LLM returning a text response instead of a tool call
-    structured_data_extractor.llm_adapter.invoke.return_value = {"text_response": "I am sorry, I cannot help with that."}
+    structured_data_extractor.llm_adapter = FakeAdapter({"text_response": "I am sorry, I cannot help with that."})
 
     initial_state = {
         "messages": [HumanMessage(content="Some unparseable text.")],
@@ -94,7 +94,7 @@ def test_structured_data_extractor_llm_fails_to_extract(structured_data_extracto
     result_state = structured_data_extractor._execute_logic(initial_state)
 
     # Assert
-    structured_data_extractor.llm_adapter.invoke.assert_called_once()
+    assert structured_data_extractor.llm_adapter.call_count == 1
     assert "extracted_data" not in result_state
     assert isinstance(result_state["messages"][0], AIMessage)
     assert "unable to extract the required 'MockUserInfo' data" in result_state["messages"][0].content
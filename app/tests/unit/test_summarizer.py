@@ -13,10 +13,6 @@ def summarizer(mock_llm_adapter):
         specialist.llm_adapter = mock_llm_adapter
         return specialist
 
-@pytest.fixture
-def mock_llm_adapter():
-    return MagicMock()
-
 def test_summarizer_summarizes_text(summarizer, mock_llm_adapter):
     # Arrange
     state = {
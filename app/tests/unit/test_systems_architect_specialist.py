@@ -2,7 +2,6 @@ import pytest
 from unittest.mock import MagicMock, ANY
 from pydantic import ValidationError
 from langchain_core.messages import AIMessage, HumanMessage
-from app.src.specialists.systems_architect import SystemsArchitect
 from app.src.specialists.schemas import SystemPlan
 from app.src.llm.adapter import StandardizedLLMRequest
 
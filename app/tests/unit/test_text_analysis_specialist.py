@@ -3,10 +3,10 @@ import json
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 from langchain_core.messages import AIMessage, HumanMessage
-from app.src.specialists.text_analysis_specialist import TextAnalysisSpecialist
 from app.src.utils.errors import LLMInvocationError
 from app.src.utils.prompt_loader import load_prompt # Import load_prompt directly
 from app.src.specialists.schemas import TextAnalysis
+from app.tests.helpers import make_mock_adapter
 
 
 def _fake_call_tool_result(data: dict) -> MagicMock:
@@ -18,17 +18,22 @@ def _fake_call_tool_result(data: dict) -> MagicMock:
     return result
 
 @pytest.fixture
-def text_analysis_specialist(initialized_specialist_factory):
-    """Fixture for an initialized TextAnalysisSpecialist with a mocked adapter."""
-    return initialized_specialist_factory("TextAnalysisSpecialist")
+def text_analysis_specialist(specialist_registry):
+    """The session's shared TextAnalysisSpecialist, with a fresh mocked adapter and no MCP clients."""
+    specialist = specialist_registry("TextAnalysisSpecialist")
+    specialist.llm_adapter = make_mock_adapter()
+    specialist.mcp_client = None
+    specialist.external_mcp_client = None
+    return specialist
 
-def test_text_analysis_with_text(text_analysis_specialist):
+def test_text_analysis_with_text(text_analysis_specialist, llm_response):
     """
     Tests the normal execution path where text is provided and successfully analyzed.
     """
     # Arrange
-    mock_response = {"summary": "Test summary", "main_points": ["Point 1", "Point 2"]}
-    text_analysis_specialist.llm_adapter.invoke.return_value = {"json_response": mock_response}
+    response = llm_response("text_analysis.summary")
+    mock_response = response["json_response"]
+    text_analysis_specialist.llm_adapter.invoke.return_value = response
 
     initial_state = {
         "messages": [HumanMessage(content="Analyze this.")],
@@ -53,7 +58,10 @@ def test_text_analysis_with_text(text_analysis_specialist):
     assert "gathered_context" in result_state["artifacts"]
     assert "Text Analysis" in result_state["artifacts"]["gathered_context"]
     assert isinstance(result_state["messages"][0], AIMessage)
-    assert "Test summary" in result_state["messages"][0].content
+    content = result_state["messages"][0].content
+    assert f"**Summary:**\n{mock_response['summary']}" in content
+    for point in mock_response["main_points"]:
+        assert f"- {point}\n" in content
 
 def test_text_analysis_without_text_self_correction(text_analysis_specialist):
     """
@@ -112,7 +120,7 @@ def test_text_analysis_handles_malformed_llm_response(text_analysis_specialist):
 # Task Completion Signal Tests
 # ==============================================================================
 
-def test_text_analysis_does_not_claim_terminal_authority(text_analysis_specialist):
+def test_text_analysis_does_not_claim_terminal_authority(text_analysis_specialist, llm_response):
     """
     Test that TA does NOT set task_is_complete.
 
@@ -121,8 +129,7 @@ def test_text_analysis_does_not_claim_terminal_authority(text_analysis_specialis
     results to gathered_context and artifacts, then yields control back to Router.
     """
     # Arrange
-    mock_response = {"summary": "Analysis complete", "main_points": ["Point 1"]}
-    text_analysis_specialist.llm_adapter.invoke.return_value = {"json_response": mock_response}
+    text_analysis_specialist.llm_adapter.invoke.return_value = llm_response("text_analysis.minimal")
 
     initial_state = {
         "messages": [HumanMessage(content="Analyze this text.")],
@@ -160,7 +167,7 @@ def test_text_analysis_no_task_complete_on_missing_text(text_analysis_specialist
 # Contextual Prompt Tests
 # ==============================================================================
 
-def test_text_analysis_treats_content_as_context(text_analysis_specialist):
+def test_text_analysis_treats_content_as_context(text_analysis_specialist, llm_response):
     """
     Test that the specialist treats uploaded content as context, not target.
 
@@ -172,8 +179,7 @@ def test_text_analysis_treats_content_as_context(text_analysis_specialist):
     so the LLM follows the user's actual request.
     """
     # Arrange
-    mock_response = {"summary": "Analysis based on context", "main_points": ["Point 1"]}
-    text_analysis_specialist.llm_adapter.invoke.return_value = {"json_response": mock_response}
+    text_analysis_specialist.llm_adapter.invoke.return_value = llm_response("text_analysis.minimal")
 
     user_request = "Using this style guide, identify LLM tells in the following snippet: 'Delve into the tapestry...'"
     reference_doc = "Style Guide: Avoid words like 'delve', 'tapestry', etc."
@@ -203,7 +209,7 @@ def test_text_analysis_treats_content_as_context(text_analysis_specialist):
     assert "Please perform the requested analysis on the following text" not in context_message.content
 
 
-def test_text_analysis_preserves_user_message(text_analysis_specialist):
+def test_text_analysis_preserves_user_message(text_analysis_specialist, llm_response):
     """
     Test that the user's original message is preserved in the context.
 
@@ -211,8 +217,7 @@ def test_text_analysis_preserves_user_message(text_analysis_specialist):
     visible to the LLM so it can follow the actual instruction.
     """
     # Arrange
-    mock_response = {"summary": "Done", "main_points": []}
-    text_analysis_specialist.llm_adapter.invoke.return_value = {"json_response": mock_response}
+    text_analysis_specialist.llm_adapter.invoke.return_value = llm_response("text_analysis.minimal")
 
     user_message = "Summarize the key takeaways from this document"
     initial_state = {
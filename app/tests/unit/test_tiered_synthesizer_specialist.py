@@ -8,7 +8,7 @@ fan-out/join pattern for CORE-CHAT-002.
 Tests graceful degradation (CORE-CHAT-002.1) when one or both progenitors fail.
 """
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 from langchain_core.messages import AIMessage
 from app.src.graph.state_factory import create_test_state
 
@@ -23,7 +23,7 @@ def test_tiered_synthesizer_initialization(tiered_synthesizer):
     """Verifies that TieredSynthesizerSpecialist initializes correctly."""
     assert tiered_synthesizer.specialist_name == "tiered_synthesizer_specialist"
     # Procedural specialist - should not have an LLM adapter
-    assert tiered_synthesizer.llm_adapter is None or isinstance(tiered_synthesizer.llm_adapter, MagicMock)
+    assert tiered_synthesizer.llm_adapter is None or isinstance(tiered_synthesizer.llm_adapter, Mock)
 
 
 def test_tiered_synthesizer_combines_both_responses(tiered_synthesizer):
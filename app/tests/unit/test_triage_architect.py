@@ -1,14 +1,9 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from app.src.specialists.triage_architect import TriageArchitect
 from app.src.interface.context_schema import ContextPlan, ContextAction, ContextActionType
 from langchain_core.messages import HumanMessage
 
-@pytest.fixture
-def mock_llm_adapter():
-    adapter = MagicMock()
-    return adapter
-
 @pytest.fixture
 def triage_architect(mock_llm_adapter):
     config = {
@@ -1,23 +1,28 @@
 # app/tests/unit/test_web_builder.py
 import pytest
 from pydantic import ValidationError
-from unittest.mock import MagicMock, patch
-from app.src.specialists.web_builder import WebBuilder
+from unittest.mock import MagicMock
 from app.src.utils.errors import LLMInvocationError
+from app.tests.helpers import FakeAdapter, FailingAdapter
+
+PLAN = {"plan_summary": "Single-page site", "execution_steps": ["Write HTML"]}
 
 @pytest.fixture
-def specialist(initialized_specialist_factory):
-    """Fixture for an initialized WebBuilder with a mocked adapter."""
-    return initialized_specialist_factory("WebBuilder")
+def specialist(specialist_registry):
+    """The session's shared WebBuilder, with its injected dependencies reset."""
+    web_builder = specialist_registry("WebBuilder")
+    web_builder.llm_adapter = FakeAdapter()
+    web_builder.mcp_client = None
+    return web_builder
 
-def test_web_builder_generates_html(specialist):
+def test_web_builder_generates_html(specialist, llm_response):
     """
     Tests that the WebBuilder correctly invokes the LLM with the current
     state and generates an HTML artifact.
     """
     # Arrange
-    mock_response = {"html_document": "<html><body>Hello</body></html>"}
-    specialist.llm_adapter.invoke.return_value = {"json_response": mock_response}
+    response = llm_response("web_builder.html_hello")
+    specialist.llm_adapter = FakeAdapter(response)
     initial_state = {"messages": []}
 
     # Act
@@ -25,9 +30,9 @@ def test_web_builder_generates_html(specialist):
 
     # Assert
     # It should call the LLM with the messages from the state.
-    specialist.llm_adapter.invoke.assert_called_once()
+    assert specialist.llm_adapter.call_count == 1
     # It should place the generated HTML into the artifacts.
-    assert result_state["artifacts"]["html_document.html"] == mock_response["html_document"]
+    assert result_state["artifacts"]["html_document.html"] == response["json_response"]["html_document"]
     # Web builder no longer recommends critic — it's a standard spoke that flows through classify_interrupt.
     assert "recommended_specialists" not in result_state.get("scratchpad", {})
     # Task 2.7: routing_history is now tracked centrally by GraphOrchestrator.safe_executor, not by specialists
@@ -36,7 +41,7 @@ def test_web_builder_generates_html(specialist):
 def test_web_builder_handles_llm_invocation_error(specialist):
     """Tests that an LLMInvocationError is propagated correctly."""
     # Arrange
-    specialist.llm_adapter.invoke.side_effect = LLMInvocationError("API is down")
+    specialist.llm_adapter = FailingAdapter(LLMInvocationError("API is down"))
     initial_state = {"messages": []}
 
     # Act & Assert
@@ -50,11 +55,46 @@ def test_web_builder_handles_llm_invocation_error(specialist):
 ], ids=["wrong_key", "no_json", "text_response_instead"])
 def test_web_builder_handles_malformed_llm_response(specialist, bad_response):
     """Tests that the specialist raises an error if the LLM response is malformed."""
-    with patch.object(specialist, 'llm_adapter') as mock_adapter:
-        # Arrange
-        mock_adapter.invoke.return_value = bad_response
-        initial_state = {"messages": []}
-
-        # Act & Assert
-        with pytest.raises((ValueError, ValidationError)):
-            specialist._execute_logic(initial_state)
\ No newline at end of file
+    # Arrange
+    specialist.llm_adapter = FakeAdapter(bad_response)
+    initial_state = {"messages": []}
+
+    # Act & Assert
+    with pytest.raises((ValueError, ValidationError)):
+        specialist._execute_logic(initial_state)
+
+
+@pytest.mark.parametrize("artifacts, mcp_behavior, expects_plan_in_prompt, expects_plan_persisted", [
+    ({}, None, False, False),
+    ({"system_plan": PLAN}, {"artifacts": {"system_plan": {"plan_summary": "unused"}}}, True, False),
+    ({}, {"artifacts": {"system_plan": PLAN}}, True, True),
+    ({}, RuntimeError("SA unreachable"), False, False),
+], ids=["no_plan_no_mcp", "existing_plan", "plan_from_mcp", "mcp_failure"])
+def test_web_builder_system_plan_sourcing(
+    specialist, artifacts, mcp_behavior, expects_plan_in_prompt, expects_plan_persisted
+):
+    """
+    Tests where WebBuilder's system_plan comes from (state, SA via MCP, or nowhere),
+    whether it is prepended to the LLM prompt, and whether a new plan is persisted.
+    """
+    # Arrange
+    specialist.llm_adapter = FakeAdapter({"json_response": {"html_document": "<html></html>"}})
+    if mcp_behavior is not None:
+        specialist.mcp_client = MagicMock()
+        if isinstance(mcp_behavior, Exception):
+            specialist.mcp_client.call.side_effect = mcp_behavior
+        else:
+            specialist.mcp_client.call.return_value = mcp_behavior
+    initial_state = {"messages": [], "artifacts": artifacts}
+
+    # Act
+    result_state = specialist._execute_logic(initial_state)
+
+    # Assert
+    sent_messages = specialist.llm_adapter.last_request.messages
+    plan_in_prompt = bool(sent_messages) and "## System Plan" in sent_messages[0].content
+    assert plan_in_prompt is expects_plan_in_prompt
+    assert ("system_plan" in result_state["artifacts"]) is expects_plan_persisted
+    if "system_plan" in artifacts:
+        # A plan already in state must not trigger a second SA call.
+        specialist.mcp_client.call.assert_not_called()
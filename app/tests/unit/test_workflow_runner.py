@@ -2,7 +2,9 @@
 import pytest
 from unittest.mock import MagicMock
 import json
+from app.src.utils import prompt_loader
 from app.src.utils.errors import WorkflowError
+from app.src.utils.prompt_loader import load_prompt
 from app.src.workflow.runner import WorkflowRunner
 
 @pytest.fixture
@@ -115,4 +117,34 @@ async def test_workflow_runner_run_streaming(mock_graph_builder):
     assert "conversation_id" in streamed_results[1]
     assert "node1" in streamed_results[2]
     assert "node2" in streamed_results[3]
-    assert "final_user_response.md" in streamed_results[3]["node2"]["artifacts"]
\ No newline at end of file
+    assert "final_user_response.md" in streamed_results[3]["node2"]["artifacts"]
+
+def test_workflow_runner_reload_picks_up_edited_prompts(mock_graph_builder, mocker, tmp_path, monkeypatch):
+    """Tests that reload() rebuilds specialists from the current prompt files, not cached text."""
+    # Arrange
+    (tmp_path / "prompts").mkdir()
+    prompt_file = tmp_path / "prompts" / "router.md"
+    monkeypatch.setattr(prompt_loader, "APP_ROOT", tmp_path)
+    load_prompt.cache_clear()
+
+    # Each GraphBuilder construction loads a prompt, as real specialists do
+    loaded_prompts = []
+    def build_graph_builder():
+        loaded_prompts.append(load_prompt("router.md"))
+        return mock_graph_builder
+    mocker.patch('app.src.workflow.runner.GraphBuilder', side_effect=build_graph_builder)
+    mocker.patch('app.src.utils.config_loader.ConfigLoader')
+    mocker.patch('app.src.workflow.runner.get_checkpointer', return_value=None)
+
+    prompt_file.write_text("v1")
+    runner = WorkflowRunner()
+
+    # Act
+    prompt_file.write_text("v2")
+    try:
+        runner.reload()
+    finally:
+        load_prompt.cache_clear()
+
+    # Assert
+    assert loaded_prompts == ["v1", "v2"]
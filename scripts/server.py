@@ -1,32 +1,83 @@
 import typer
-import psutil
 import subprocess
+import json
 import os
+import select
+import signal
+import socket
 import sys
 import time
 import logging
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typing_extensions import Annotated
 
+# psutil and dotenv are imported where needed: status and stop with no server
+# running never touch either, and they are the bulk of this script's import time.
+if TYPE_CHECKING:
+    import psutil
+
 # --- Configuration ---
 # This script should be run from the project root.
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 RUN_DIR = os.path.join(PROJECT_ROOT, ".run")
 LOGS_DIR = os.path.join(PROJECT_ROOT, "logs")
 
-# --- Environment Loading ---
-# Load environment variables from .env file in the project root.
-# This ensures the server process inherits the necessary secrets.
-load_dotenv(os.path.join(PROJECT_ROOT, ".env"))
-
 SERVER_PID_FILE = os.path.join(RUN_DIR, "server.pid")
+# CPU/RSS snapshots the server writes for status (app/src/observability/process_stats.py).
+SERVER_STATS_FILE = os.path.join(RUN_DIR, "server_stats.json")
+STATS_FILE_ENV = "LAS_PROCESS_STATS_FILE"
+# A snapshot not refreshed within this many publish intervals (plus slack for
+# scheduling jitter) means the server stopped publishing.
+STATS_MAX_AGE_INTERVALS = 2
+STATS_AGE_SLACK_S = 1.0
 SERVER_LOG_FILE = os.path.join(LOGS_DIR, "agentic_server.log")
 LOG_CONFIG_FILE = os.path.join(PROJECT_ROOT, "log_config.yaml")
+# Uvicorn gets a JSON copy of LOG_CONFIG_FILE, so server boot skips PyYAML.
+COMPILED_LOG_CONFIG_FILE = os.path.join(RUN_DIR, "log_config.json")
 GRADIO_APP_FILE = os.path.join(PROJECT_ROOT, "app", "src", "ui", "gradio_app.py")
 PORT = 8000
+# How long start() gives the server to come up or fail, and how often it checks.
+STARTUP_WINDOW_S = 3.0
+STARTUP_POLL_INTERVAL_S = 0.1
+# How long stop() waits after SIGTERM before SIGKILL, and how often it checks.
+STOP_TIMEOUT_S = 5.0
+STOP_POLL_INTERVAL_S = 0.05
+
+# --- Environment Loading ---
+@lru_cache(maxsize=None)
+def _load_env_once():
+    """
+    Loads environment variables from the .env file in the project root, so
+    processes we launch inherit the necessary secrets. Only commands that
+    launch processes call this; stop and status never read .env, and
+    restart/ui pay for it at most once.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(PROJECT_ROOT, ".env"))
 
 # --- Setup Logging ---
 # This script has its own simple logger for control-related messages.
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to the stream's own buffering instead
+    of flushing after every record. logging's atexit shutdown flushes it;
+    call _flush_logs() before blocking so pending lines show up first.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def _flush_logs():
+    """Writes out buffered control messages before a wait or a foreground child."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
 def setup_logging():
     """Sets up logging for this control script."""
     os.makedirs(LOGS_DIR, exist_ok=True)
@@ -34,7 +85,7 @@ def setup_logging():
         level=logging.INFO,
         format="%(asctime)s - [SERVER_CONTROL] - %(levelname)s - %(message)s",
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            _BufferedStreamHandler(sys.stdout)
         ]
     )
 
@@ -42,24 +93,230 @@ app = typer.Typer(
     help="A Python-based server control script for the agentic application."
 )
 
-def _is_server_running() -> psutil.Process | None:
-    """Checks if the server process is running based on the PID file."""
-    if not os.path.exists(SERVER_PID_FILE):
-        return None
+# A live process whose start time differs from the recorded one by more than
+# this is a different process that was handed the same PID.
+CREATE_TIME_TOLERANCE_S = 1.0
+
+def _write_pid_file(proc: "psutil.Process"):
+    """Records the server's PID with the start time and executable that identify it."""
+    with proc.oneshot():
+        record = {"pid": proc.pid, "exe": proc.exe(), "create_time": proc.create_time()}
+    with open(SERVER_PID_FILE, "w") as f:
+        json.dump(record, f)
+
+def _remove_pid_file(stale: bool = False):
+    """Deletes the PID file if there is one, without a separate exists() check."""
+    try:
+        os.remove(SERVER_PID_FILE)
+    except FileNotFoundError:
+        return
+    if stale:
+        logging.warning(f"Removed stale PID file: {SERVER_PID_FILE}")
+
+def _read_pid_file() -> dict | None:
+    """
+    The PID file's record ({pid, exe, create_time}), or None if there is no
+    PID file. Older plain-text files ("pid" or "pid create_time") yield only
+    the fields they have. Raises ValueError if the file is unreadable.
+    """
     try:
         with open(SERVER_PID_FILE, "r") as f:
-            pid = int(f.read().strip())
-        proc = psutil.Process(pid)
-        # Check if the process name contains 'python' or 'uvicorn' for extra safety
-        if 'python' in proc.name().lower() or 'uvicorn' in proc.name().lower():
-            return proc
-    except (psutil.NoSuchProcess, FileNotFoundError, ValueError):
-        if os.path.exists(SERVER_PID_FILE):
-            logging.warning(f"Removing stale PID file: {SERVER_PID_FILE}")
-            os.remove(SERVER_PID_FILE)
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        record = json.loads(content)
+    except ValueError:
+        record = None
+    if isinstance(record, dict):
+        return record
+    fields = content.split()
+    if not fields:
+        raise ValueError(f"Empty PID file: {SERVER_PID_FILE}")
+    record = {"pid": int(fields[0])}
+    if len(fields) > 1:
+        record["create_time"] = float(fields[1])
+    return record
+
+def _is_recorded_server(proc: "psutil.Process", record: dict) -> bool:
+    """True if `proc` is the process the PID file record describes."""
+    # oneshot() lets create_time() and exe() share one read of the process's stat
+    with proc.oneshot():
+        # The recorded start time guards against PID reuse
+        if "create_time" in record:
+            if abs(proc.create_time() - float(record["create_time"])) > CREATE_TIME_TOLERANCE_S:
+                return False
+        # The server runs under our interpreter; PID files written before
+        # the executable was recorded are checked against that.
+        expected_exe = record.get("exe") or os.path.realpath(sys.executable)
+        return proc.exe() == expected_exe
+
+def _is_server_running() -> "psutil.Process | None":
+    """
+    Checks if the server process is running based on the PID file. This is
+    the one place that clears a stale PID file: one whose process is gone,
+    whose PID now belongs to another process, or that can't be read.
+    """
+    try:
+        record = _read_pid_file()
+    except ValueError:
+        record = {}
+    if record is None:
         return None
+    import psutil
+    try:
+        proc = psutil.Process(int(record["pid"]))
+        if _is_recorded_server(proc, record):
+            return proc
+    except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError, KeyError, TypeError):
+        # AccessDenied: someone else's process holds the PID now
+        pass
+    _remove_pid_file(stale=True)
     return None
 
+def _compiled_log_config() -> str:
+    """
+    Path to a JSON copy of log_config.yaml for Uvicorn's --log-config,
+    regenerated whenever the YAML is newer. log_config.yaml stays the file
+    to edit; only launches after an edit pay for parsing it.
+    """
+    try:
+        if os.path.getmtime(COMPILED_LOG_CONFIG_FILE) >= os.path.getmtime(LOG_CONFIG_FILE):
+            return COMPILED_LOG_CONFIG_FILE
+    except FileNotFoundError:
+        pass
+    import yaml
+    with open(LOG_CONFIG_FILE, "r") as f:
+        config = yaml.safe_load(f)
+    os.makedirs(os.path.dirname(COMPILED_LOG_CONFIG_FILE), exist_ok=True)
+    # Write-then-rename so a concurrent launch never reads a partial file
+    tmp_path = f"{COMPILED_LOG_CONFIG_FILE}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(config, f, indent=2)
+    os.replace(tmp_path, COMPILED_LOG_CONFIG_FILE)
+    return COMPILED_LOG_CONFIG_FILE
+
+def _port_accepts_connections() -> bool:
+    """True if something is listening on the server port."""
+    try:
+        with socket.create_connection(("127.0.0.1", PORT), timeout=0.1):
+            return True
+    except OSError:
+        return False
+
+class _SpawnedServer:
+    """The part of the subprocess.Popen interface start() uses, for a posix_spawn'd child."""
+
+    def __init__(self, pid: int, stdout_fd: int):
+        self.pid = pid
+        self.returncode: int | None = None
+        self.stdout = os.fdopen(stdout_fd, "r")
+
+    def poll(self) -> int | None:
+        if self.returncode is None:
+            pid, wait_status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(wait_status)
+        return self.returncode
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            _, wait_status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(wait_status)
+        return self.returncode
+
+def _spawn_server(command: list[str], env: dict[str, str]) -> "subprocess.Popen | _SpawnedServer":
+    """
+    Launches the server detached, with stdout and stderr on one pipe so the
+    health check can report startup errors.
+
+    On POSIX this is os.posix_spawn, which starts the child without
+    duplicating this process's address space first. Windows keeps Popen.
+    """
+    if sys.platform == "win32":
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Redirect stderr to stdout
+            text=True,  # Decode streams as text
+            cwd=PROJECT_ROOT,
+            env=env,
+            # DETACHED_PROCESS detaches the process from the console
+            creationflags=subprocess.DETACHED_PROCESS,
+        )
+
+    # posix_spawn has no cwd argument (until 3.13's POSIX_SPAWN_CHDIR), so the
+    # child inherits ours. Every path this script uses is absolute.
+    os.chdir(PROJECT_ROOT)
+    # Both ends are close-on-exec; dup2 onto fds 1 and 2 gives the child the write end.
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            command[0], command, env,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_DUP2, write_fd, 2),  # Redirect stderr to stdout
+            ],
+            # Detaches the process from the controlling terminal
+            setsid=True,
+        )
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+    return _SpawnedServer(pid, read_fd)
+
+def _read_startup_output(process: "subprocess.Popen | _SpawnedServer") -> str:
+    """
+    Everything an exited server wrote to its pipe. The process is already
+    dead, so direct reads replace communicate()'s select loop (or reader
+    threads on Windows). Non-blocking, so a leftover child still holding
+    the pipe open can't hang the read.
+
+    Reads the raw fd: on a non-blocking pipe with no data yet,
+    TextIOWrapper.read() raises TypeError instead of returning.
+    """
+    fd = process.stdout.fileno()
+    # os.set_blocking() doesn't exist on Windows before Python 3.12, and
+    # rejects pipes on some builds; a blocking read still ends at EOF.
+    if hasattr(os, "set_blocking"):
+        try:
+            os.set_blocking(fd, False)
+        except OSError:
+            pass
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            break  # Drained, but another process still holds the write end
+        if not chunk:
+            break  # EOF
+        chunks.append(chunk)
+    encoding = process.stdout.encoding
+    process.stdout.close()
+    process.wait()
+    return b"".join(chunks).decode(encoding, errors="replace")
+
+def _wait_for_startup(process: "subprocess.Popen | _SpawnedServer", wait_full_window: bool = False):
+    """
+    Waits up to STARTUP_WINDOW_S for the server to come up or fail.
+
+    Returns as soon as the process exits or the port starts accepting
+    connections. Uvicorn's startup lines go to the log file, not our pipe,
+    so the port is the readiness signal. A server still starting when the
+    window closes is treated as started, as before.
+    """
+    _flush_logs()
+    deadline = time.monotonic() + STARTUP_WINDOW_S
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return
+        if not wait_full_window and _port_accepts_connections():
+            return
+        time.sleep(STARTUP_POLL_INTERVAL_S)
+
 @app.command()
 def start(
     foreground: Annotated[bool, typer.Option(
@@ -73,16 +330,22 @@ def start(
         logging.info(f"Server is already running with PID {proc.pid}.")
         return
 
+    _load_env_once()
+    # Plain Uvicorn rather than Gunicorn with --preload: a preloading master only
+    # shares its imports with the workers it forks, and stop/restart replace the
+    # whole process tree, so every restart would still pay the full import.
+    # Gunicorn also doesn't run on Windows.
     command = [
         sys.executable,  # Use the same python interpreter that's running this script
         "-m", "uvicorn", "app.src.api:app",
         "--host", "0.0.0.0", "--port", str(PORT),
-        "--log-config", LOG_CONFIG_FILE
+        "--log-config", _compiled_log_config()
     ]
 
     if foreground:
         logging.info("Starting Agentic API server in the foreground...")
         logging.info("Press Ctrl+C to stop the server.")
+        _flush_logs()
         try:
             # When running in the foreground, we execute directly and block.
             # The Uvicorn process will inherit the standard streams.
@@ -98,28 +361,21 @@ def start(
     logging.info("Starting Agentic API server...")
     logging.info(f"Server logs are configured to be written to: {SERVER_LOG_FILE}")
 
-    # Start the process with stdout and stderr piped so we can check for startup errors.
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,  # Redirect stderr to stdout
-        text=True,  # Decode streams as text
-        cwd=PROJECT_ROOT,
-        # On Unix, start_new_session=True detaches the process from the controlling terminal
-        # On Windows, DETACHED_PROCESS flag is used for the same purpose.
-        creationflags=subprocess.DETACHED_PROCESS if sys.platform == "win32" else 0,
-        start_new_session=(sys.platform != "win32")
-    )
+    # If something already listens on PORT, a successful connect can't tell us
+    # our server is up, so the health check must wait out the full window.
+    port_was_busy = _port_accepts_connections()
+
+    process = _spawn_server(command, env={**os.environ, STATS_FILE_ENV: SERVER_STATS_FILE})
 
     # --- Health Check ---
     logging.info("Performing server health check...")
-    time.sleep(3)  # Give it a few seconds to start up or fail.
+    _wait_for_startup(process, wait_full_window=port_was_busy)
 
     if process.poll() is not None:
         logging.error("="*80)
         logging.error("SERVER FAILED TO START. See error output below.")
         logging.error("="*80)
-        startup_output, _ = process.communicate()
+        startup_output = _read_startup_output(process)
         logging.error(startup_output)
         with open(SERVER_LOG_FILE, "a") as f:
             f.write("\n" + "="*80 + "\n")
@@ -128,61 +384,220 @@ def start(
             f.write("="*80 + "\n")
         return
 
-    with open(SERVER_PID_FILE, "w") as f:
-        f.write(str(process.pid))
+    import psutil
+    _write_pid_file(psutil.Process(process.pid))
 
     logging.info(f"Server started successfully with PID {process.pid}.")
     logging.info(f"Access the API at http://127.0.0.1:{PORT}")
     if process.stdout:
         process.stdout.close()
 
-@app.command()
-def stop():
-    """Stops the running Uvicorn server."""
-    proc = _is_server_running()
-    if not proc:
-        logging.info("Server is not running.")
-        # If the process isn't running but the PID file exists, clean it up.
-        if os.path.exists(SERVER_PID_FILE):
-            logging.warning(f"Removing stale PID file: {SERVER_PID_FILE}")
-            os.remove(SERVER_PID_FILE)
-        return
+def _reap_if_child(pid: int) -> bool:
+    """
+    Reaps `pid` if it is our own exited child; True if it was reaped. ui()
+    starts the server from this process, so it may be our child; until
+    reaped it would linger as a zombie that still answers kill(0).
+    """
+    try:
+        reaped_pid, _ = os.waitpid(pid, os.WNOHANG)
+        return bool(reaped_pid)
+    except ChildProcessError:
+        return False  # Not our child; its parent (init) reaps it
 
-    logging.info(f"Stopping server with PID {proc.pid}...")
+def _pid_has_exited(pid: int) -> bool:
+    """True once `pid` is gone (POSIX). Reaps it if it is our own child."""
+    if _reap_if_child(pid):
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+def _wait_for_pid_exit(pid: int, timeout: float | None, pidfd: int | None = None) -> bool:
+    """
+    Waits until `pid` exits; False if `timeout` seconds pass first. With a
+    pidfd this is a single poll() that wakes when the process exits;
+    otherwise it polls the PID every STOP_POLL_INTERVAL_S.
+    """
+    _flush_logs()
+    if pidfd is not None:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)  # Readable once the process exits
+        if not poller.poll(None if timeout is None else int(timeout * 1000)):
+            return False
+        _reap_if_child(pid)
+        return True
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not _pid_has_exited(pid):
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(STOP_POLL_INTERVAL_S)
+    return True
+
+def _open_pidfd(pid: int) -> int | None:
+    """A pidfd for `pid` (Linux 5.3+), or None where pidfds are unavailable."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        raise
+    except OSError:
+        return None  # ENOSYS on older kernels, or blocked by a seccomp filter
+
+def _send_signal(pid: int, pidfd: int | None, sig: int):
+    """Signals the server through its pidfd if we have one, else by PID."""
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+def _stop_with_signals(proc: "psutil.Process"):
+    """
+    SIGTERM, then SIGKILL after STOP_TIMEOUT_S. Where pidfds are available,
+    signals and the exit wait go through one, so they can't reach a process
+    that later reuses the PID. Otherwise the PID, already verified by
+    _is_server_running(), is signalled directly.
+    """
+    pid = proc.pid
+    pidfd = None
+    try:
+        try:
+            pidfd = _open_pidfd(pid)
+            # The pidfd pins whichever process holds the PID now. Re-check it
+            # is still the one _is_server_running() verified.
+            if pidfd is not None and not proc.is_running():
+                raise ProcessLookupError(pid)
+            # Graceful shutdown
+            _send_signal(pid, pidfd, signal.SIGTERM)
+        except ProcessLookupError:
+            # This can happen if the process terminates between the _is_server_running() check and the signal
+            logging.info("Process already stopped.")
+            return
+        if _wait_for_pid_exit(pid, timeout=STOP_TIMEOUT_S, pidfd=pidfd):
+            logging.info("Server stopped gracefully.")
+            return
+        logging.warning(f"Server did not stop gracefully after {STOP_TIMEOUT_S:g} seconds. Forcing termination...")
+        try:
+            _send_signal(pid, pidfd, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        _wait_for_pid_exit(pid, timeout=None, pidfd=pidfd)  # Wait for the killed process to be reaped
+        logging.info("Server terminated.")
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+def _stop_with_psutil(proc: "psutil.Process"):
+    """Windows stop: terminate, then kill after STOP_TIMEOUT_S."""
+    import psutil
     try:
         # Graceful shutdown
         proc.terminate()
         # Wait for the process to terminate
-        proc.wait(timeout=5)
+        _flush_logs()
+        proc.wait(timeout=STOP_TIMEOUT_S)
         logging.info("Server stopped gracefully.")
     except psutil.TimeoutExpired:
-        logging.warning("Server did not stop gracefully after 5 seconds. Forcing termination...")
+        logging.warning(f"Server did not stop gracefully after {STOP_TIMEOUT_S:g} seconds. Forcing termination...")
         proc.kill()
         proc.wait() # Wait for the killed process to be reaped
         logging.info("Server terminated.")
     except psutil.NoSuchProcess:
         # This can happen if the process terminates between the _is_server_running() check and proc.terminate()
         logging.info("Process already stopped.")
+
+@app.command()
+def stop():
+    """Stops the running Uvicorn server."""
+    proc = _is_server_running()
+    if not proc:
+        logging.info("Server is not running.")
+        return
+
+    logging.info(f"Stopping server with PID {proc.pid}...")
+    try:
+        if sys.platform == "win32":
+            # os.kill(pid, 0) terminates the process on Windows, so the
+            # signal-based liveness polling below is POSIX-only.
+            _stop_with_psutil(proc)
+        else:
+            _stop_with_signals(proc)
     finally:
         # Ensure the PID file is always removed after a stop attempt
-        if os.path.exists(SERVER_PID_FILE):
-            os.remove(SERVER_PID_FILE)
+        _remove_pid_file()
 
 @app.command()
 def restart():
     """Restarts the server."""
     logging.info("Restarting server...")
+    # stop() returns only once the old process has exited (or been killed and
+    # reaped), so start() can follow immediately.
     stop()
-    time.sleep(1)
     start()
 
+def _average_cpu_percent(proc: "psutil.Process") -> float:
+    """
+    CPU usage averaged over the process lifetime, without sampling.
+
+    cpu_percent(interval=...) has to sleep between two samples, and a
+    non-blocking call has no earlier sample to compare against in a
+    one-shot CLI. Total CPU time over wall time since start needs neither.
+    """
+    cpu_times = proc.cpu_times()
+    elapsed = time.time() - proc.create_time()
+    if elapsed <= 0:
+        return 0.0
+    return (cpu_times.user + cpu_times.system) / elapsed * 100
+
+def _read_published_stats() -> dict | None:
+    """
+    The server's latest self-published CPU/RSS snapshot, if it is fresh and
+    belongs to the process in the PID file. Costs two small file reads and
+    no psutil import or /proc queries.
+
+    A snapshot counts as ours only if its PID and start time match the PID
+    file record, so one left behind by an earlier server is ignored. A
+    server killed with SIGKILL never removes its snapshot; on POSIX a
+    kill(pid, 0) catches that before the snapshot goes stale.
+    """
+    try:
+        record = _read_pid_file()
+        with open(SERVER_STATS_FILE, "r") as f:
+            stats = json.load(f)
+        if not record or "create_time" not in record:
+            return None  # PID files from before start times were recorded
+        if stats["pid"] != int(record["pid"]):
+            return None
+        if abs(stats["create_time"] - float(record["create_time"])) > CREATE_TIME_TOLERANCE_S:
+            return None
+        max_age = STATS_MAX_AGE_INTERVALS * stats["interval"] + STATS_AGE_SLACK_S
+        if time.time() - stats["updated_at"] > max_age:
+            return None
+        # os.kill(pid, 0) terminates the process on Windows; there the age check has to do
+        if sys.platform != "win32":
+            os.kill(stats["pid"], 0)
+        return stats
+    except (FileNotFoundError, ProcessLookupError, PermissionError, ValueError, KeyError, TypeError):
+        # PermissionError: kill(pid, 0) on a PID now owned by another user
+        return None
+
 @app.command()
 def status():
     """Checks the status of the server."""
-    if proc := _is_server_running():
+    if stats := _read_published_stats():
+        logging.info(f"Server is RUNNING with PID {stats['pid']}.")
+        logging.info(f"  - CPU: {stats['cpu_percent']:.1f}% (last {stats['interval']:g}s)")
+        logging.info(f"  - Memory: {stats['rss'] / 1024 / 1024:.2f} MB")
+    elif proc := _is_server_running():
+        # oneshot() caches the per-process stat reads shared by these calls.
+        with proc.oneshot():
+            cpu = _average_cpu_percent(proc)
+            mem = proc.memory_info().rss
         logging.info(f"Server is RUNNING with PID {proc.pid}.")
-        logging.info(f"  - CPU: {proc.cpu_percent(interval=0.1)}%")
-        logging.info(f"  - Memory: {proc.memory_info().rss / 1024 / 1024:.2f} MB")
+        logging.info(f"  - CPU: {cpu:.1f}% (average since start)")
+        logging.info(f"  - Memory: {mem / 1024 / 1024:.2f} MB")
     else:
         logging.info("Server is STOPPED.")
 
@@ -198,6 +613,7 @@ def ui(
     Starts the full application: the API server (in the background) and the Gradio UI.
     """
     logging.info("--- Launching Agentic System with UI ---")
+    _load_env_once()
 
     # 1. Ensure the API server is running in the background
     if not _is_server_running():
@@ -213,6 +629,7 @@ def ui(
     # 2. Launch the Gradio UI in the foreground
     logging.info(f"Starting Gradio UI on port {port}...")
     gradio_command = [sys.executable, GRADIO_APP_FILE, "--port", str(port)]
+    _flush_logs()
     try:
         subprocess.run(gradio_command, cwd=PROJECT_ROOT)
     except KeyboardInterrupt: